@@ -20,6 +20,32 @@ CLI Usage:
         --account "Acme" \\
         --data-json '{"account": {}, "opportunity": {}}'
 
+    # Batch mode: one JSON record per line, rendered across a process pool
+    python3 ps_doc_skill.py \\
+        --batch accounts.jsonl \\
+        --workers 8 \\
+        --output-dir "./ps-knowledge-transfer"
+
+    # Warm render server; later invocations forward to it automatically
+    python3 ps_doc_skill.py --serve &
+
+    # Merge per-source JSON exports (salesforce.json, granola.json, gong.json, …)
+    python3 ps_doc_skill.py --sources ./acme-dumps/ --sections general chat
+
+    # Check a data file's shape without rendering (python-docx not imported)
+    python3 ps_doc_skill.py --validate-only --data-file "/tmp/ps_doc_data.json"
+
+    # Refresh the scoping values of an already-edited doc in place
+    python3 ps_doc_skill.py --update ./PS_Knowledge_Transfer_acme_2026-01-31.docx \\
+        --data-file "/tmp/ps_doc_data.json"
+
+    # One spreadsheet of every account's scoping fields (no documents rendered)
+    python3 ps_doc_skill.py --batch accounts.jsonl --export scoping.csv
+
+    # Per-stage render timings as JSON lines, plus a cProfile dump
+    python3 ps_doc_skill.py --account "Acme" --data-file "/tmp/ps_doc_data.json" \\
+        --profile timings.jsonl --pstats render.pstats
+
 Requires:
     pip install python-docx
 """
@@ -27,50 +53,75 @@ Requires:
 from __future__ import annotations
 
 import argparse
+import copy
+import heapq
+import io
 import json
+import os
+import re
 import sys
+import time
+from collections import namedtuple
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
-try:
-    from docx import Document
-    from docx.shared import Pt, Inches, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.table import WD_TABLE_ALIGNMENT
-    from docx.oxml.ns import nsdecls
-    from docx.oxml import parse_xml
-except ImportError:
-    print("ERROR: python-docx is not installed.")
-    print("Fix:   pip install python-docx")
-    sys.exit(1)
+# python-docx (and lxml beneath it) dominates startup time, so it is imported
+# on first render by _require_docx() rather than at module import. --help,
+# --validate-only and argument/data errors never pay for it.
+Document = Pt = Inches = RGBColor = None
+WD_ALIGN_PARAGRAPH = WD_TABLE_ALIGNMENT = nsdecls = parse_xml = DocxDocument = None
+
+
+def _require_docx() -> None:
+    """Import python-docx into module globals on first use."""
+    global Document, Pt, Inches, RGBColor, WD_ALIGN_PARAGRAPH, WD_TABLE_ALIGNMENT
+    global nsdecls, parse_xml, DocxDocument
+    if Document is not None:
+        return
+    try:
+        from docx import Document
+        from docx.shared import Pt, Inches, RGBColor
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.enum.table import WD_TABLE_ALIGNMENT
+        from docx.oxml.ns import nsdecls
+        from docx.oxml import parse_xml
+        from docx.document import Document as DocxDocument
+    except ImportError:
+        print("ERROR: python-docx is not installed.")
+        print("Fix:   pip install python-docx")
+        sys.exit(1)
 
 
 # ── Styling constants ─────────────────────────────────────────────────────────
 
 NAVY     = "1F3864"
 BLUE     = "4472C4"
-WHITE    = RGBColor(0xFF, 0xFF, 0xFF)
-NAVY_RGB = RGBColor(0x1F, 0x38, 0x64)
-GREY_RGB = RGBColor(0x66, 0x66, 0x66)
+GREY     = "666666"
+WHITE    = "FFFFFF"
 
 
 # ── Styling helpers ───────────────────────────────────────────────────────────
 
+_SHADING: dict[str, object] = {}
+
+
 def _set_cell_shading(cell, color_hex: str) -> None:
-    shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}"/>')
-    cell._tc.get_or_add_tcPr().append(shading)
+    if color_hex not in _SHADING:
+        _SHADING[color_hex] = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}"/>')
+    cell._tc.get_or_add_tcPr().append(copy.deepcopy(_SHADING[color_hex]))
 
 
 def _cell_text(cell, text: str, bold: bool = False,
-               size: Pt = Pt(10), color: RGBColor | None = None) -> None:
+               size: float = 10, color: str | None = None) -> None:
     cell.text = ""
     p = cell.paragraphs[0]
     run = p.add_run(text)
     run.bold = bold
-    run.font.size = size
+    run.font.size = Pt(size)
     run.font.name = "Arial"
     if color:
-        run.font.color.rgb = color
+        run.font.color.rgb = RGBColor.from_string(color)
 
 
 def _make_table(doc: Document, col_widths: tuple = (2.5, 4.5)):
@@ -82,8 +133,8 @@ def _make_table(doc: Document, col_widths: tuple = (2.5, 4.5)):
         row.cells[0].width = Inches(col_widths[0])
         row.cells[1].width = Inches(col_widths[1])
     hdr = table.rows[0]
-    _cell_text(hdr.cells[0], "Field",    bold=True, size=Pt(10), color=WHITE)
-    _cell_text(hdr.cells[1], "SC Input", bold=True, size=Pt(10), color=WHITE)
+    _cell_text(hdr.cells[0], "Field",    bold=True, size=10, color=WHITE)
+    _cell_text(hdr.cells[1], "SC Input", bold=True, size=10, color=WHITE)
     _set_cell_shading(hdr.cells[0], NAVY)
     _set_cell_shading(hdr.cells[1], NAVY)
     return table
@@ -93,7 +144,7 @@ def _section_header(table, text: str, color_hex: str = NAVY) -> None:
     """Full-width merged section header row."""
     row = table.add_row()
     row.cells[0].merge(row.cells[1])
-    _cell_text(row.cells[0], text, bold=True, size=Pt(11), color=WHITE)
+    _cell_text(row.cells[0], text, bold=True, size=11, color=WHITE)
     _set_cell_shading(row.cells[0], color_hex)
 
 
@@ -101,7 +152,7 @@ def _sub_header(table, text: str, color_hex: str = BLUE) -> None:
     """Full-width merged sub-section header row."""
     row = table.add_row()
     row.cells[0].merge(row.cells[1])
-    _cell_text(row.cells[0], text, bold=True, size=Pt(10), color=WHITE)
+    _cell_text(row.cells[0], text, bold=True, size=10, color=WHITE)
     _set_cell_shading(row.cells[0], color_hex)
 
 
@@ -119,83 +170,2438 @@ def _data_row(table, field: str, value: str) -> None:
     r1.font.name = "Arial"
 
 
-def _out_of_scope_notice(doc: Document, channel: str, notes: str = "") -> None:
+# ── Data helpers ──────────────────────────────────────────────────────────────
+
+def _fmt_list(items: list, bullet: str = "•") -> str:
+    if not items:
+        return "TBD"
+    return "\n".join(f"{bullet} {item}" for item in items)
+
+
+def _fmt_dict(d: dict) -> str:
+    """Render a dict as bullet lines: '• Key: Value'."""
+    if not d:
+        return "TBD"
+    return "\n".join(
+        f"• {k.replace('_', ' ').title()}: {v}"
+        for k, v in d.items()
+    )
+
+
+# ── Data schema ───────────────────────────────────────────────────────────────
+#
+# DATA_SCHEMA declares every payload field the renderer reads. It is compiled
+# once into nested normalizer closures (_COMPILED_SCHEMA) that check a payload
+# in one pass, collecting every error with its path, and return it in
+# canonical form: text fields are str (numbers converted), list fields are
+# lists (a bare value becomes a one-item list), contacts are "Name — Role"
+# lines. The render path relies on that form and does no type sniffing of its
+# own. Keys the schema does not declare (transcripts, Gong calls, …) are
+# passed through unchecked.
+
+_TEXT, _SCALAR, _BOOL, _DATE, _CONTACTS = "text", "scalar", "bool", "date", "contacts"
+
+
+class _Obj(namedtuple("_Obj", "fields text_ok", defaults=(False,))):
+    """A JSON object with declared ``fields``; ``text_ok`` also accepts a bare string."""
+
+
+class _Items(namedtuple("_Items", "item strict", defaults=(False,))):
+    """A JSON array of ``item``; unless ``strict``, a bare value is a one-item list."""
+
+
+class _Map(namedtuple("_Map", "value")):
+    """A JSON object with free-form keys, every value of type ``value``."""
+
+
+_DEMO_SCHEMA = _Obj({"feedback": _TEXT, "gong_call_url": _TEXT, "date": _TEXT})
+_SCOPE_SCHEMA = _Obj({"out_of_scope": _BOOL, "notes": _TEXT})
+
+DATA_SCHEMA = _Obj({
+    "account_name": _TEXT,
+    "sc_name":      _TEXT,
+    "generated":    _DATE,
+    "account": _Obj({
+        **dict.fromkeys((
+            "name", "platform", "hq", "founded", "funding", "timezone", "current_stack",
+            "primary_use_case", "close_date", "salesforce_url", "chat_platform",
+            "chat_handoff", "segmentation", "auth_requirements",
+        ), _TEXT),
+        **dict.fromkeys((
+            "business_drivers", "risks", "next_steps", "secondary_use_cases",
+            "chat_use_cases", "languages",
+        ), _Items(_TEXT)),
+        "key_architecture": _Map(_TEXT),
+        "key_volumes":      _Map(_SCALAR),
+        "contacts":         _CONTACTS,
+        "demo_recap":       _DEMO_SCHEMA,
+    }),
+    "opportunity": _Obj(dict.fromkeys(("sf_url", "close_date", "product_channels"), _TEXT)),
+    "demo_recap":  _DEMO_SCHEMA,
+    "granola_notes": _Items(_Obj({
+        **dict.fromkeys(("title", "date", "meeting_date", "summary"), _TEXT),
+        "key_points": _Items(_TEXT),
+    }, text_ok=True), strict=True),
+    "chat_scoping":  _SCOPE_SCHEMA,
+    "email_scoping": _SCOPE_SCHEMA,
+    "voice_scoping": _SCOPE_SCHEMA,
+})
+
+_JSON_TYPES = {dict: "object", list: "array", str: "string", int: "number", float: "number",
+               bool: "boolean", type(None): "null"}
+
+
+def _json_type(value) -> str:
+    return _JSON_TYPES.get(type(value), type(value).__name__)
+
+
+def _compile_schema(spec):
+    """Compile a schema node into ``norm(value, path, errors) -> canonical value``."""
+    if spec == _TEXT:
+        def norm(value, path, errors):
+            if isinstance(value, str):
+                return value
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return str(value)
+            errors.append(f"{path}: expected string, got {_json_type(value)}")
+        return norm
+
+    if spec == _SCALAR:
+        def norm(value, path, errors):
+            if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                return value
+            errors.append(f"{path}: expected string or number, got {_json_type(value)}")
+        return norm
+
+    if spec == _DATE:
+        def norm(value, path, errors):
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+                return value
+            except (TypeError, ValueError):
+                errors.append(f"{path}: expected YYYY-MM-DD date, got {value!r}")
+        return norm
+
+    if spec == _BOOL:
+        def norm(value, path, errors):
+            if isinstance(value, bool):
+                return value
+            errors.append(f"{path}: expected boolean, got {_json_type(value)}")
+        return norm
+
+    if spec == _CONTACTS:
+        text = _compile_schema(_TEXT)
+
+        def norm(value, path, errors):
+            # {"Name": "Role"}, ["Name — Role" or {"name", "role"}, …] or one string
+            if isinstance(value, dict):
+                return [name if role is None else f"{name} — {text(role, f'{path}.{name}', errors)}"
+                        for name, role in value.items()]
+            out = []
+            for i, item in enumerate(value if isinstance(value, list) else [value]):
+                if isinstance(item, dict) and "name" in item:
+                    role = item.get("role") or item.get("title") or ""
+                    out.append(f"{item['name']} — {role}" if role else str(item["name"]))
+                else:
+                    out.append(text(item, f"{path}[{i}]", errors))
+            return out
+        return norm
+
+    if isinstance(spec, _Items):
+        item, strict = _compile_schema(spec.item), spec.strict
+
+        def norm(value, path, errors):
+            if not isinstance(value, list):
+                if strict or isinstance(value, dict):
+                    errors.append(f"{path}: expected array, got {_json_type(value)}")
+                    return None
+                value = [value]
+            return [item(v, f"{path}[{i}]", errors) for i, v in enumerate(value)]
+        return norm
+
+    if isinstance(spec, _Map):
+        val = _compile_schema(spec.value)
+
+        def norm(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append(f"{path}: expected object, got {_json_type(value)}")
+                return None
+            return {k: val(v, f"{path}.{k}", errors) for k, v in value.items() if v is not None}
+        return norm
+
+    fields = tuple((key, _compile_schema(sub)) for key, sub in spec.fields.items())
+    text_ok = spec.text_ok
+
+    def norm(value, path, errors):
+        if not isinstance(value, dict):
+            if text_ok and isinstance(value, str):
+                return value
+            errors.append(f"{path or 'payload'}: expected object, got {_json_type(value)}")
+            return None
+        out = dict(value)
+        for key, sub in fields:
+            v = value.get(key)
+            if v is None:
+                out.pop(key, None)
+            else:
+                out[key] = sub(v, f"{path}.{key}" if path else key, errors)
+        return out
+    return norm
+
+
+_COMPILED_SCHEMA = _compile_schema(DATA_SCHEMA)
+
+
+def normalize_data(data) -> tuple[dict | None, list[str]]:
+    """
+    Check ``data`` against DATA_SCHEMA and bring it to canonical form.
+
+    Pure-stdlib so it can run before python-docx is imported. Missing keys are
+    fine (they render as TBD); ``null`` counts as missing.
+
+    Returns
+    -------
+    tuple — (normalized copy of the payload, one message per problem). The
+            input is not modified; the copy is only meaningful without errors.
+    """
+    errors: list[str] = []
+    return _COMPILED_SCHEMA(data, "", errors), errors
+
+
+def validate_data(data) -> list[str]:
+    """Every DATA_SCHEMA violation in ``data`` (see normalize_data); empty when valid."""
+    return normalize_data(data)[1]
+
+
+def _checked(data) -> dict:
+    """Normalized ``data``, or ValueError listing every schema violation."""
+    data, errors = normalize_data(data)
+    if errors:
+        raise ValueError("invalid data: " + "; ".join(errors))
+    return data
+
+
+# ── Streaming input ───────────────────────────────────────────────────────────
+#
+# Scratch files can carry full Gong transcripts and Gmail threads that the
+# renderer never looks at. load_render_data() walks the JSON incrementally and
+# only materializes the fields listed in _RENDER_FIELDS, skipping everything
+# else without building it — Granola notes keep only their rendered fields, for
+# rank_notes() to choose from — so peak memory tracks the rendered content
+# rather than the payload size.
+
+_STREAM_CHUNK = 1 << 16
+
+
+class _ListSpec(namedtuple("_ListSpec", "item")):
+    """A JSON array whose items are each projected by ``item``."""
+
+
+def _projection(spec):
+    """Streaming projection spec for a DATA_SCHEMA node."""
+    if isinstance(spec, _Obj):
+        return {key: _projection(sub) for key, sub in spec.fields.items()}
+    if isinstance(spec, _Items) and isinstance(spec.item, _Obj):
+        return _ListSpec(_projection(spec.item))
+    return True
+
+
+# True materializes the whole value, a dict projects an object to the listed
+# keys, a _ListSpec projects each item of an array.
+_RENDER_FIELDS = _projection(DATA_SCHEMA)
+
+_WS = re.compile(r"[ \t\n\r]*")
+_SCALAR_END = re.compile(r"[\s,\]}]")
+# Plain strings, brackets, or a lone quote (escaped/cut-off string → _skip_string)
+_SKIP_TOKEN = re.compile(r'"[^"\\]*"|[\[\]{}]|"')
+
+
+class _JsonStream:
+    """Minimal pull parser over a text file: project or skip one JSON value at a time."""
+
+    def __init__(self, fh, chunk: int = _STREAM_CHUNK) -> None:
+        self._fh = fh
+        self._chunk = chunk
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping what has been consumed. False at EOF."""
+        data = "" if self._eof else self._fh.read(self._chunk)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ("" at EOF)."""
+        while True:
+            self._pos = _WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        c = self._peek()
+        if not c or c not in chars:
+            raise ValueError(f"expected one of {chars!r}, got {c or 'EOF'!r}")
+        self._pos += 1
+        return c
+
+    def value(self):
+        """Materialize the next value with the stdlib decoder."""
+        c = self._peek()
+        if c and c not in '"[{':
+            # A scalar cut at the chunk edge ("2015." or "1e") decodes as a shorter
+            # number: only decode once the delimiter after it is buffered.
+            while not _SCALAR_END.search(self._buf, self._pos) and self._fill():
+                pass
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            self._pos = end
+            return obj
+
+    def _skip_string(self) -> None:
+        self._pos += 1   # opening quote
+        while True:
+            i = self._buf.find('"', self._pos)
+            if i < 0:
+                # Keep a trailing backslash run: it may escape a quote in the next chunk
+                tail = len(self._buf) - len(self._buf.rstrip("\\"))
+                self._pos = len(self._buf) - tail
+                if not self._fill():
+                    raise ValueError("unterminated string")
+                continue
+            j = i
+            while j > self._pos and self._buf[j - 1] == "\\":
+                j -= 1
+            self._pos = i + 1
+            if (i - j) % 2 == 0:
+                return
+
+    def skip(self) -> None:
+        """Consume the next value without building it."""
+        c = self._peek()
+        if not c:
+            raise ValueError("unexpected end of input")
+        if c == '"':
+            self._skip_string()
+            return
+        if c not in "[{":
+            while True:   # scalar: number, true, false, null
+                m = _SCALAR_END.search(self._buf, self._pos)
+                if m:
+                    self._pos = m.start()
+                    return
+                self._pos = len(self._buf)
+                if not self._fill():
+                    return
+
+        # Container: scan whole strings and brackets with one regex per buffer;
+        # scalars, commas and colons between them are irrelevant to nesting.
+        depth = 0
+        while True:
+            buf = self._buf
+            for m in _SKIP_TOKEN.finditer(buf, self._pos):
+                tok = buf[m.start()]   # avoid copying whole string tokens
+                if tok == '"':
+                    if m.end() - m.start() == 1:   # escaped, or runs past the buffer
+                        self._pos = m.start()
+                        self._skip_string()
+                        break
+                elif tok in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        self._pos = m.end()
+                        return
+            else:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise ValueError("unexpected end of input")
+
+    def project(self, spec):
+        """Read the next value, keeping only what ``spec`` asks for."""
+        c = self._peek()
+        if isinstance(spec, dict) and c == "{":
+            self._pos += 1
+            out = {}
+            if self._peek() == "}":
+                self._pos += 1
+                return out
+            while True:
+                key = self.value()
+                self._expect(":")
+                if key in spec:
+                    out[key] = self.project(spec[key])
+                else:
+                    self.skip()
+                if self._expect(",}") == "}":
+                    return out
+        if isinstance(spec, _ListSpec) and c == "[":
+            self._pos += 1
+            items = []
+            if self._peek() == "]":
+                self._pos += 1
+                return items
+            while True:
+                items.append(self.project(spec.item))
+                if self._expect(",]") == "]":
+                    return items
+        return self.value()
+
+
+def load_render_data(path: str | Path) -> dict:
+    """
+    Stream a data file, materializing only the fields generate_ps_doc renders.
+
+    Peak memory is bounded by the rendered fields plus one read chunk,
+    regardless of how large the skipped transcripts/threads are.
     """
-    Render an out-of-scope notice above a scoping table.
+    with open(path, encoding="utf-8") as fh:
+        stream = _JsonStream(fh)
+        data = stream.project(_RENDER_FIELDS)
+        if stream._peek():
+            raise ValueError("trailing data after payload")
+    return data
+
+
+def _read_data_file(path: str | Path, stream: bool = False) -> dict:
+    """Load a data file whole, or through load_render_data() when ``stream`` is set."""
+    if stream:
+        return load_render_data(path)
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+# ── Source ingestion ──────────────────────────────────────────────────────────
+#
+# Phase A's offline dumps arrive as one JSON export per source in a directory
+# (salesforce.json, granola.json, gong.json, …; a source split across several
+# dumps adds ``<source>-<part>.json`` files). ingest_sources() reads them all
+# concurrently, merges them into the payload generate_ps_doc() takes — records
+# deduplicated by id and date — and returns the Source Count Gate inventory
+# alongside it, so nothing round-trips through a scratch file.
+
+class _Source(namedtuple("_Source", "label merge")):
+    """A per-source export: its Source Count Gate label and how it merges into the payload."""
+
+
+def _record_date(rec) -> str:
+    return str(rec.get("date") or rec.get("meeting_date") or "") if isinstance(rec, dict) else ""
+
+
+def _record_key(rec) -> tuple:
+    if not isinstance(rec, dict):
+        return (str(rec).strip(), "")
+    ident = rec.get("id") or rec.get("url") or rec.get("title") or rec.get("subject")
+    return (str(ident or json.dumps(rec, sort_keys=True)).strip(), _record_date(rec))
+
+
+def _merge_records(existing: list, records) -> list:
+    """
+    Append ``records`` to ``existing``, collapsing entries with the same id and date.
+
+    A duplicate fills in fields the first copy left empty (the semantic and
+    keyword searches often return the same call with different detail). The
+    result is newest first; undated entries keep their order at the end.
+    """
+    if not isinstance(records, list):
+        raise ValueError(f"expected a JSON array of records, got {type(records).__name__}")
+    index = {_record_key(rec): rec for rec in existing}
+    merged = list(existing)
+    for rec in records:
+        key = _record_key(rec)
+        first = index.get(key)
+        if first is None:
+            index[key] = rec
+            merged.append(rec)
+        elif isinstance(first, dict):
+            for field, value in rec.items():
+                if value and not first.get(field):
+                    first[field] = value
+    merged.sort(key=_record_date, reverse=True)
+    return merged
+
+
+def _gate_entry(rec, *title_keys: str) -> tuple[str, str, str]:
+    """(title, date, url) for one Source Count Gate line."""
+    if not isinstance(rec, dict):
+        return (str(rec), "", "")
+    title = next((str(rec[k]) for k in title_keys if rec.get(k)), "Untitled")
+    return (title, _record_date(rec), str(rec.get("url") or rec.get("gong_call_url") or ""))
+
+
+def _merge_object(data: dict, key: str, payload) -> None:
+    if not isinstance(payload, dict):
+        raise ValueError(f"expected a JSON object, got {type(payload).__name__}")
+    data.setdefault(key, {}).update(payload)
+
+
+def _merge_salesforce(data: dict, payload) -> list:
+    payload = dict(payload) if isinstance(payload, dict) else payload
+    _merge_object(data, "opportunity", payload)
+    opp = data["opportunity"]
+    for key in ("sc_name", "account_name"):
+        if opp.get(key):
+            data[key] = opp.pop(key)
+    return [(opp.get("name") or "Salesforce opportunity", str(opp.get("close_date") or ""),
+             str(opp.get("sf_url") or ""))]
+
+
+def _merge_account(data: dict, payload) -> list:
+    _merge_object(data, "account", payload)
+    acct = data["account"]
+    return [(acct.get("name") or "Account context", "", str(acct.get("salesforce_url") or ""))]
+
+
+def _merge_granola(data: dict, payload) -> list:
+    data["granola_notes"] = _merge_records(data.get("granola_notes", []), payload)
+    return [_gate_entry(rec, "title") for rec in data["granola_notes"]]
+
+
+def _merge_gong(data: dict, payload) -> list:
+    """A list of calls, or {"calls": [...], "emails": [...], "demo_recap": {...}}."""
+    if isinstance(payload, list):
+        payload = {"calls": payload}
+    elif not isinstance(payload, dict):
+        raise ValueError(f"expected a JSON object or array, got {type(payload).__name__}")
+    for kind in ("calls", "emails"):
+        if kind in payload:
+            data[f"gong_{kind}"] = _merge_records(data.get(f"gong_{kind}", []), payload[kind])
+    if payload.get("demo_recap"):
+        _merge_object(data, "demo_recap", payload["demo_recap"])
+    return ([_gate_entry(rec, "title") for rec in data.get("gong_calls", [])]
+            + [_gate_entry(rec, "subject", "title") for rec in data.get("gong_emails", [])])
+
+
+def _merge_gmail(data: dict, payload) -> list:
+    data["gmail_threads"] = _merge_records(data.get("gmail_threads", []), payload)
+    return [_gate_entry(rec, "subject", "title") for rec in data["gmail_threads"]]
+
+
+def _merge_ada(data: dict, payload) -> list:
+    _merge_object(data, "ada", payload)
+    ada = data["ada"]
+    return [(ada.get("handle") or "Ada bot", "", str(ada.get("url") or ""))]
+
+
+def _merge_scoping(data: dict, payload) -> list:
+    """{"chat": {...}, "email": {...}, "voice": {...}} → the *_scoping sections."""
+    if not isinstance(payload, dict):
+        raise ValueError(f"expected a JSON object, got {type(payload).__name__}")
+    entries = []
+    for channel, answers in payload.items():
+        key = channel if channel.endswith("_scoping") else f"{channel}_scoping"
+        if key not in DATA_SCHEMA.fields:
+            raise ValueError(f"unknown scoping channel {channel!r}")
+        _merge_object(data, key, answers)
+        entries.append((key, "", ""))
+    return entries
+
+
+INGEST_SOURCES = {
+    "salesforce": _Source("1a Salesforce opportunity", _merge_salesforce),
+    "account":    _Source("1b Account context",        _merge_account),
+    "granola":    _Source("1c Granola meetings",       _merge_granola),
+    "gong":       _Source("1d Gong calls and emails",  _merge_gong),
+    "gmail":      _Source("1e Gmail threads",          _merge_gmail),
+    "ada":        _Source("1f Ada bot",                _merge_ada),
+    "scoping":    _Source("Scoping answers",           _merge_scoping),
+}
+
+# SFDC product_channels is authoritative for channel scope (see the skill's
+# Phase B); explicit out_of_scope flags from a scoping export still win.
+_CHANNEL_TERMS = {"chat": ("chat", "messaging"), "email": ("email",), "voice": ("voice", "phone")}
+
+
+def _apply_channel_scope(data: dict) -> None:
+    channels = str((data.get("opportunity") or {}).get("product_channels") or "").lower()
+    if not channels:
+        return
+    for channel, terms in _CHANNEL_TERMS.items():
+        scoping = data.setdefault(f"{channel}_scoping", {})
+        scoping.setdefault("out_of_scope", not any(t in channels for t in terms))
+
+
+def _source_files(directory: Path, name: str) -> list[Path]:
+    return sorted(directory.glob(f"{name}.json")) + sorted(directory.glob(f"{name}-*.json"))
+
+
+def _read_source(path: Path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path}: invalid JSON: {e}") from None
+
+
+async def ingest_sources_async(
+    directory: str | Path,
+    require: tuple[str, ...] = (),
+) -> tuple[dict, dict[str, list[tuple[str, str, str]]]]:
+    """
+    Coroutine behind ingest_sources(); loads every export file concurrently.
+
+    Files are read and parsed on worker threads and merged in a fixed source
+    order, so the payload does not depend on which load finishes first.
+    """
+    import asyncio
+
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise ValueError(f"sources directory not found: {directory}")
+    unknown = set(require) - set(INGEST_SOURCES)
+    if unknown:
+        raise ValueError(f"unknown source(s): {', '.join(sorted(unknown))}")
+    files = {name: _source_files(directory, name) for name in INGEST_SOURCES}
+    paths = [path for name in INGEST_SOURCES for path in files[name]]
+    payloads = dict(zip(paths, await asyncio.gather(
+        *(asyncio.to_thread(_read_source, path) for path in paths))))
+
+    data: dict = {}
+    inventory: dict[str, list[tuple[str, str, str]]] = {}
+    for name, source in INGEST_SOURCES.items():
+        entries: list = []
+        for path in files[name]:
+            try:
+                entries = source.merge(data, payloads[path])
+            except ValueError as e:
+                raise ValueError(f"{path}: {e}") from None
+        inventory[name] = entries
+    _apply_channel_scope(data)
+
+    missing = [INGEST_SOURCES[name].label for name in require if not inventory[name]]
+    if missing:
+        raise ValueError(f"source count gate: 0 results from {', '.join(missing)}")
+    data, errors = normalize_data(data)
+    if errors:
+        raise ValueError(f"merged payload is invalid: {'; '.join(errors)}")
+    return data, inventory
+
+
+def ingest_sources(
+    directory: str | Path,
+    require: tuple[str, ...] = (),
+) -> tuple[dict, dict[str, list[tuple[str, str, str]]]]:
+    """
+    Merge a directory of per-source JSON exports into one render payload.
+
+    Parameters
+    ----------
+    directory : holds ``<source>.json`` (and ``<source>-<part>.json``) files
+                for the sources in INGEST_SOURCES; absent sources count as 0
+    require   : sources that must yield at least one entry, else ValueError
+
+    Returns
+    -------
+    tuple — (data for generate_ps_doc, {source: [(title, date, url), …]})
+    """
+    import asyncio
+
+    return asyncio.run(ingest_sources_async(directory, require))
+
+
+def source_gate_lines(inventory: dict[str, list[tuple[str, str, str]]]) -> list[str]:
+    """Source Count Gate report for an ingest_sources() inventory."""
+    lines = []
+    for name, entries in inventory.items():
+        label = INGEST_SOURCES[name].label
+        if not entries:
+            lines.append(f"⚠️ {label} — 0 results returned")
+            continue
+        lines.append(f"✅ {label} — {len(entries)} found:")
+        for n, entry in enumerate(entries, 1):
+            lines.append(f"  {n}. " + " — ".join(part for part in entry if part))
+    return lines
+
+
+# ── Keyword signals ───────────────────────────────────────────────────────────
+#
+# Next steps and risks are classified into keyword buckets (promises, blockers,
+# security asks, integrations, lost-deal markers) by one compiled regex, once
+# per account, and the result is shared by every section that needs it.
+# Keywords match case-insensitively at the start of a word, so "commit" also
+# finds "commitment" but "ada to" does not fire inside "Canada to".
+
+DEFAULT_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "promises":     ("promise", "commit", "agreed", "provide", "ada to"),
+    "blockers":     ("blocker", "blocked", "blocking", "dependency", "waiting on",
+                     "legal review", "procurement", "budget", "delay"),
+    "security":     ("security", "infosec", "soc 2", "soc2", "sso", "saml", "gdpr", "hipaa",
+                     "pii", "dpa", "pen test", "penetration test", "encryption"),
+    "integrations": ("api", "integration", "integrate", "webhook", "sdk", "crm", "salesforce",
+                     "zendesk", "kustomer", "gorgias", "shopify", "okta", "oauth"),
+    "lost":         ("likely lost",),
+}
+
+
+class KeywordMatcher:
+    """One precompiled regex classifying text into every keyword bucket at once."""
+
+    def __init__(self, buckets: dict[str, tuple[str, ...] | list[str]]) -> None:
+        self.buckets = {name: tuple(kw.lower() for kw in kws) for name, kws in buckets.items()}
+        owners: dict[str, set[str]] = {}
+        for name, kws in self.buckets.items():
+            for kw in kws:
+                owners.setdefault(kw, set()).add(name)
+        # A match reports the longest keyword at each position; shorter
+        # keywords that are its prefix matched there too.
+        self._owners = {
+            kw: frozenset().union(*(b for k, b in owners.items() if kw.startswith(k)))
+            for kw in owners
+        }
+        alternation = "|".join(re.escape(kw) for kw in sorted(owners, key=len, reverse=True))
+        # Zero-width lookahead so overlapping keywords at later positions are found too
+        self._regex = re.compile(rf"\b(?=({alternation}))") if owners else None
+        # classify_items keeps a result per item: share one set per bucket combination
+        self._combos: dict[frozenset[str], frozenset[str]] = {}
+        self.fingerprint = json.dumps(self.buckets, sort_keys=True)
+
+    def classify(self, text: str) -> frozenset[str]:
+        """Buckets whose keywords occur in ``text``."""
+        if self._regex is None:
+            return frozenset()
+        hits = self._regex.findall(text.lower())
+        if not hits:
+            return frozenset()
+        owners = self._owners
+        buckets = frozenset().union(*[owners[kw] for kw in hits])
+        return self._combos.setdefault(buckets, buckets)
+
+    def classify_items(self, items: list) -> list[tuple[object, frozenset[str]]]:
+        return [(item, self.classify(str(item))) for item in items]
+
+
+# "base" is the file the process was started with; server requests fall back to it
+_KEYWORDS = {"matcher": None, "path": None, "base": None}
+
+
+def load_keywords(path: str | Path | None) -> KeywordMatcher:
+    """
+    Install the keyword buckets used for classification.
+
+    ``path`` is a JSON object of {bucket: [keyword, …]}; its buckets replace
+    or extend DEFAULT_KEYWORDS. ``None`` restores the defaults.
+    """
+    buckets = dict(DEFAULT_KEYWORDS)
+    if path is not None:
+        with open(path, encoding="utf-8") as fh:
+            custom = json.load(fh)
+        if not isinstance(custom, dict) or not all(
+                isinstance(v, list) and all(isinstance(k, str) for k in v) for v in custom.values()):
+            raise ValueError(f"{path}: expected a JSON object of bucket -> list of keywords")
+        buckets.update(custom)
+    _KEYWORDS["matcher"] = KeywordMatcher(buckets)
+    _KEYWORDS["path"] = None if path is None else str(path)
+    return _KEYWORDS["matcher"]
+
+
+def _keyword_matcher() -> KeywordMatcher:
+    if _KEYWORDS["matcher"] is None:
+        load_keywords(None)
+    return _KEYWORDS["matcher"]
+
+
+def _use_keywords(path: str | None) -> None:
+    """Make ``path`` the active keyword file (workers and server requests)."""
+    if _KEYWORDS["matcher"] is None or _KEYWORDS["path"] != path:
+        load_keywords(path)
+
+
+# ── Table row specs ───────────────────────────────────────────────────────────
+#
+# Each scoping table is described as a list of rows:
+#   ("row", field, value)  — standard two-column data row
+#   ("sub", text)          — full-width sub-section header
+# The same spec drives both the cold build and the skeleton patch path.
+#
+# Tables are declared as field specs (_Field / _Sub) and compiled once into
+# accessor closures; _table_rows() then only evaluates closures per account.
+# A field's sources are dotted paths rooted at "account", "opportunity" or
+# "demo" (the demo recap), or callables of the account's _Context for derived
+# values. The first non-empty source wins and is passed through ``fmt``;
+# when every source is empty the field renders ``fallback``.
+
+def _cell_value(value) -> str:
+    return str(value) if value else "TBD"
+
+
+class _Context:
+    """Per-account resolution context; keyword signals are classified once, on first use."""
+
+    __slots__ = ("account", "opportunity", "demo", "_signals")
+
+    def __init__(self, acct: dict, opp: dict, demo: dict) -> None:
+        self.account, self.opportunity, self.demo = acct, opp, demo
+        self._signals = None
+
+    @property
+    def signals(self) -> dict[str, list[tuple[object, frozenset[str]]]]:
+        """{"next_steps": [(item, buckets), …], "risks": […]}"""
+        if self._signals is None:
+            matcher = _keyword_matcher()
+            self._signals = {
+                "next_steps": matcher.classify_items(self.account.get("next_steps", [])),
+                "risks":      matcher.classify_items(self.account.get("risks", [])),
+            }
+        return self._signals
+
+    def matching(self, bucket: str, *sources: str) -> list:
+        """Items from ``sources`` (default: all) classified into ``bucket``, deduplicated."""
+        seen, items = set(), []
+        for source in sources or self.signals:
+            for item, buckets in self.signals[source]:
+                key = str(item)
+                if bucket in buckets and key not in seen:
+                    seen.add(key)
+                    items.append(item)
+        return items
+
+
+def _context(data: dict) -> _Context:
+    acct, opp, demo, _, _ = _unpack(data)
+    return _Context(acct, opp, demo)
+
+
+class _Field(namedtuple("_Field", "key label sources fmt fallback",
+                        defaults=((), None, "TBD"))):
+    """One Field / SC Input row; ``key`` names it in exports and lookups."""
+
+
+class _Sub(namedtuple("_Sub", "text")):
+    """Full-width sub-section header row."""
+
+
+def _client_overview(ctx: _Context) -> str:
+    acct = ctx.account
+    overview_parts: list[str] = []
+    for field in ("platform", "hq", "founded", "funding"):
+        val = acct.get(field, "")
+        if val:
+            overview_parts.append(val if field == "platform" else f"{field.title()}: {val}")
+    drivers = acct.get("business_drivers", [])
+    if drivers:
+        overview_parts.append("\nBusiness Drivers:")
+        for d in drivers:
+            overview_parts.append(f"  • {d}")
+    return "\n".join(overview_parts)
+
+
+def _project_scope(ctx: _Context) -> str:
+    acct = ctx.account
+    primary_uc    = acct.get("primary_use_case", "")
+    secondary_ucs = acct.get("secondary_use_cases", [])
+    scope_parts: list[str] = []
+    if primary_uc:
+        scope_parts.append(f"Phase 1: {primary_uc}")
+    for i, uc in enumerate(secondary_ucs):
+        scope_parts.append(f"Phase {i + 2}: {uc}")
+    return "\n\n".join(scope_parts)
+
+
+def _channels_supported(ctx: _Context) -> str:
+    volumes = ctx.account.get("key_volumes")
+    return _fmt_dict(volumes) if volumes else ctx.account.get("current_stack")
+
+
+def _promises(ctx: _Context) -> list:
+    """Product promises — any next step that mentions a commitment from Ada."""
+    return ctx.matching("promises", "next_steps")
+
+
+def _security_asks(ctx: _Context) -> list:
+    return ctx.matching("security")
+
+
+def _open_risks(ctx: _Context) -> list:
+    return [r for r, buckets in ctx.signals["risks"] if "lost" not in buckets]
+
+
+_GENERAL_FIELDS = (
+    _Field("client_overview", "Client Overview\n\nOverview of Account + Business case with Ada",
+           (_client_overview,), fallback="TBD — needs discovery notes"),
+    _Field("sfdc_opp", "SFDC Opp", ("opportunity.sf_url", "account.salesforce_url")),
+    _Field("solution_survey", "Solution Survey"),
+    _Field("stakeholders", "Key client stakeholders & Roles", ("account.contacts",), _fmt_list),
+    _Field("timezone", "Timezone", ("account.timezone", "account.hq")),
+    _Field("channels_supported", "Channels currently supported", (_channels_supported,)),
+    _Field("tech_stack", "Agent Tech Stack", ("account.current_stack",)),
+    _Field("kb_readiness", "KB Readiness\n\nFormatted and ready for AI agent ingestion or updates required",
+           fallback="TBD — needs assessment"),
+    _Field("project_scope", "Project Scope\n\nWhat will Phase 1 include? What will Phase 2 include?",
+           (_project_scope,)),
+    _Field("launch_date", "Expected Launch Date?", ("opportunity.close_date", "account.close_date")),
+    _Field("success_criteria", "Success Criteria 30 days post launch", ("demo.feedback",),
+           fallback="TBD — capture during discovery/demo debrief"),
+    _Field("channels", "Channels\n\nWhat channels will they plan to deploy on?",
+           ("opportunity.product_channels",)),
+    _Field("languages", "Language Requirements", fallback="English"),
+    _Field("apis", "APIs / Personalization / Authentication Requirements",
+           ("account.key_architecture",), _fmt_dict),
+    _Field("segmentation", "Segmentation Requirements"),
+    _Field("promises", "Product promises made to the client / FRs?", (_promises,), _fmt_list),
+    _Field("cluster", "Cluster", fallback="• Maple"),
+    _Field("ai_agents", "Number of AI Agents", fallback="1"),
+
+    _Sub("Miscellaneous"),
+    _Field("ada_academy", "Enrolled in Ada Academy", fallback="No (pre-signature)"),
+    _Field("security", "Security Requirements", (_security_asks,), _fmt_list),
+    _Field("demo_link", "Link + invites to Demo/Sandbox instance", ("demo.gong_call_url",)),
+    _Field("pilot", "Pilot / Opt out"),
+    _Field("risks", "Additional Notes / Risks", (_open_risks,), _fmt_list),
+)
+
+_CHAT_FIELDS = (
+    _Field("platform", "Current Chat Platform",
+           ("account.chat_platform", "account.key_architecture.chat", "account.current_stack")),
+    _Field("volume", "Monthly Chat Volume", ("account.key_volumes.chat_monthly",)),
+    _Field("handoff", "Current Handoff Setup\n\nHow are chats handed off to human agents today?",
+           ("account.chat_handoff",)),
+    _Field("apis", "APIs / Integrations Required", ("account.key_architecture",), _fmt_dict),
+    _Field("segmentation", "Segmentation Requirements", ("account.segmentation",)),
+    _Field("use_cases", "Chat-Specific Use Cases", ("account.chat_use_cases",), _fmt_list),
+    _Field("kb_readiness", "KB Readiness for Chat", fallback="TBD — needs assessment"),
+    _Field("languages", "Language Requirements", ("account.languages",), _fmt_list,
+           fallback="English"),
+    _Field("authentication", "Authentication Requirements",
+           ("account.auth_requirements", "account.key_architecture.auth_api")),
+)
+
+_EMAIL_FIELDS = (
+    _Sub("Email Architecture"),
+    _Field("tech_stack", "Tech Stack\n\nIs the system your agents use to receive and respond to emails the same as your chat? Name the system.",
+           ("account.current_stack",)),
+    _Field("landscape", "Email landscape\n\nWhich email address(es) are your customers emailing?"),
+    _Field("webform", "Webform\n\nDo you have a webform or contact form on your website?"),
+    _Field("filtering", "Custom / Filter Incoming Emails\n\nDo you want to limit incoming emails to specific use cases/topics?"),
+    _Field("agent_address", "AI Agent / Human support\n\nWhich email address will the AI Agent respond as?"),
+    _Field("launch_plan", "Launch plan\n\nDo you require a gradual rollout?"),
+
+    _Sub("Email Configuration"),
+    _Field("knowledge_base", "Knowledge Base\n\nAny additional sources specific to email?"),
+    _Field("use_cases", "Use cases\n\nAre there any use cases unique to email vs chat/voice?"),
+    _Field("workflows", "Workflow Mapping\n\nAny notable differences in workflows for email vs chat?"),
+    _Field("cc_support", "CC Support\n\nDo you need your AI Agent to support multiple email participants?"),
+    _Field("metadata", "Metadata\n\nDo you currently pass metadata about your customers to Ada?"),
+
+    _Sub("Email Handoffs"),
+    _Field("ticketing", "Email / Ticketing\n\nAny differences in how AI agent hands off on email?"),
+    _Field("routing", "Routing\n\nSpecific use cases forwarded to a separate inbox?"),
+
+    _Sub("Additional Requirements"),
+    _Field("authentication", "Authentication\n\nDo you need the AI Agent to authenticate customers via email?"),
+    _Field("conversation_start", "Conversation Start\n\nDo you need a workflow at the start of each email conversation?"),
+)
+
+_VOICE_FIELDS = (
+    _Sub("Voice Architecture"),
+    _Field("telephony", "Telephony Provider"),
+    _Field("ccaas", "CCaaS / Agent System\n\nWhat system do your phone agents accept calls in?"),
+    _Field("sip", "SIP Integration Type"),
+    _Field("ivr", "Current IVR\n\nCan you share an IVR map?"),
+    _Field("direction", "Inbound vs Outbound", fallback="Inbound only"),
+    _Field("call_volume", "Call Volume", ("account.key_volumes.voice_calls_monthly",)),
+    _Field("agent_count", "Current Agent Count", ("account.key_volumes.agents",)),
+    _Field("missed_call_rate", "Missed Call Rate", ("account.key_volumes.missed_calls_pct",)),
+
+    _Sub("Voice Use Cases"),
+    _Field("primary_use_case", "Primary Voice Use Case", ("account.primary_use_case",)),
+    _Field("triage", "Call Categorization / Triage"),
+    _Field("secondary_use_cases", "Secondary Voice Use Cases",
+           ("account.secondary_use_cases",), _fmt_list),
+
+    _Sub("Voice Technical Requirements"),
+    _Field("apis", "APIs Required for Voice", ("account.key_architecture",), _fmt_dict),
+    _Field("dtmf", "DTMF / Dial Pad Input"),
+    _Field("sms", "SMS Capabilities"),
+    _Field("cross_channel", "Cross-Channel Interoperability"),
+
+    _Sub("Voice Handoffs"),
+    _Field("handoff", "Handoff to Human Agents"),
+    _Field("routing", "Routing Requirements"),
+
+    _Sub("Voice Quality & Success Criteria"),
+    _Field("demo_feedback", "Voice Quality Feedback from Demo", ("demo.feedback",)),
+    _Field("success_criteria", "Success Criteria for Voice"),
+    _Field("risks", "Voice-Specific Risks", (_open_risks,), _fmt_list),
+    _Field("timeline", "Timeline", ("opportunity.close_date", "account.close_date")),
+)
+
+_SECTION_FIELDS = {
+    "general": _GENERAL_FIELDS,
+    "chat":    _CHAT_FIELDS,
+    "email":   _EMAIL_FIELDS,
+    "voice":   _VOICE_FIELDS,
+}
+
+_SECTION_ORDER = tuple(_SECTION_FIELDS)
+_PATH_ROOTS = ("account", "opportunity", "demo")
+
+
+def _compile_source(source):
+    """Compile a dotted source path into a closure over a _Context."""
+    if callable(source):
+        return source
+    root, *keys = source.split(".")
+    if root not in _PATH_ROOTS:
+        raise ValueError(f"unknown field source root {root!r} in {source!r}")
+    if len(keys) == 1:
+        key = keys[0]
+
+        def get(ctx):
+            d = getattr(ctx, root)
+            return d.get(key) if isinstance(d, dict) else None
+        return get
+
+    def walk(ctx):
+        d = getattr(ctx, root)
+        for key in keys:
+            if not isinstance(d, dict):
+                return None
+            d = d.get(key)
+        return d
+    return walk
+
+
+def _compile_field(field: _Field):
+    """Compile a field spec into ``resolve(ctx) -> str``."""
+    getters = tuple(_compile_source(s) for s in field.sources)
+    fmt, fallback = field.fmt, field.fallback
+
+    if not getters:
+        return lambda ctx: fallback
+
+    def resolve(ctx):
+        for get in getters:
+            value = get(ctx)
+            if value:
+                return (fmt(value) if fmt else value) or fallback
+        return fallback
+    return resolve
+
+
+def _compile_section(fields: tuple) -> tuple:
+    return tuple(("sub", f.text) if isinstance(f, _Sub)
+                 else ("row", f.label, _compile_field(f), f.key)
+                 for f in fields)
+
+
+_COMPILED_SECTIONS = {name: _compile_section(fields) for name, fields in _SECTION_FIELDS.items()}
+
+
+def _table_rows(section: str, ctx: _Context) -> list[tuple]:
+    """Evaluate a section's compiled field specs into table row specs."""
+    return [row if row[0] == "sub" else ("row", row[1], row[2](ctx))
+            for row in _COMPILED_SECTIONS[section]]
+
+
+def resolve_fields(data: dict, sections: list[str] | None = None) -> dict[str, str]:
+    """
+    Resolve every scoping field of ``data`` to its rendered cell text.
+
+    Pure-stdlib (no python-docx). Keys are "<section>.<field key>", e.g.
+    "general.launch_date", in document order; ``sections`` defaults to all.
+    """
+    return _resolve(_context(_checked(data)), sections)
+
+
+def _resolve(ctx: _Context, sections: list[str] | None = None) -> dict[str, str]:
+    return {
+        f"{section}.{row[3]}": _cell_value(row[2](ctx))
+        for section in (sections or _SECTION_ORDER)
+        for row in _COMPILED_SECTIONS[section]
+        if row[0] == "row"
+    }
+
+
+def _fill_table(table, rows: list[tuple]) -> None:
+    for row in rows:
+        if row[0] == "sub":
+            _sub_header(table, row[1])
+        else:
+            _data_row(table, row[1], row[2])
+
+
+# ── Render profiling ──────────────────────────────────────────────────────────
+#
+# Opt-in instrumentation. While a _Timings recorder is active, every stage of a
+# render (skeleton clone, title page, each section, Granola notes, save, cache)
+# records wall time and the net number of memory blocks it left allocated, and
+# the hot styling helpers are swapped for counting wrappers. With profiling off
+# stages are a shared no-op and nothing is wrapped.
+
+_PROFILED_HELPERS = ("_data_row", "_sub_header", "_section_header", "_set_cell_shading",
+                     "_cell_text", "_patch_table", "_ox_table")
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class _Stage:
+    __slots__ = ("entry", "t0", "b0")
+
+    def __init__(self, entry: list):
+        self.entry = entry
+
+    def __enter__(self):
+        self.b0 = sys.getallocatedblocks()
+        self.t0 = time.perf_counter()
+
+    def __exit__(self, *exc) -> bool:
+        self.entry[0] += 1
+        self.entry[1] += time.perf_counter() - self.t0
+        self.entry[2] += sys.getallocatedblocks() - self.b0
+        return False
+
+
+class _NoStage:
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NO_STAGE = _NoStage()
+
+
+class _Timings:
+    """Stage and helper counters for one render."""
+
+    def __init__(self):
+        self.stages: dict[str, list] = {}                               # [calls, s, blocks]
+        self.helpers = {name: [0, 0.0] for name in _PROFILED_HELPERS}   # [calls, s]
+        self.suspended = False
+        self.start = time.perf_counter()
+        self.blocks = sys.getallocatedblocks()
+
+    def stage(self, name: str):
+        if self.suspended:
+            return _NO_STAGE
+        return _Stage(self.stages.setdefault(name, [0, 0.0, 0]))
+
+    def record(self, **meta) -> dict:
+        return {
+            **meta,
+            "total_ms": _ms(time.perf_counter() - self.start),
+            "alloc_blocks": sys.getallocatedblocks() - self.blocks,
+            "stages": {name: {"calls": c, "ms": _ms(t), "alloc_blocks": b}
+                       for name, (c, t, b) in self.stages.items()},
+            "helpers": {name: {"calls": c, "ms": _ms(t)}
+                        for name, (c, t) in self.helpers.items()},
+        }
+
+
+_TIMINGS: _Timings | None = None
+
+
+def _stage(name: str):
+    """Context manager timing one render stage (a no-op unless profiling)."""
+    return _NO_STAGE if _TIMINGS is None else _TIMINGS.stage(name)
+
+
+class _suspended_stages:
+    """Attribute one-off work (e.g. building a skeleton) to the enclosing stage only."""
+
+    def __enter__(self):
+        if _TIMINGS is not None:
+            self.previous, _TIMINGS.suspended = _TIMINGS.suspended, True
+
+    def __exit__(self, *exc) -> bool:
+        if _TIMINGS is not None:
+            _TIMINGS.suspended = self.previous
+        return False
+
+
+def _counting(fn, entry: list):
+    def wrapper(*args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            entry[0] += 1
+            entry[1] += time.perf_counter() - t0
+    return wrapper
+
+
+def _start_profiling(timings: _Timings) -> dict:
+    """Activate ``timings`` and wrap the profiled helpers; returns the originals."""
+    global _TIMINGS
+    g = globals()
+    originals = {name: g[name] for name in _PROFILED_HELPERS}
+    for name, fn in originals.items():
+        g[name] = _counting(fn, timings.helpers[name])
+    _TIMINGS = timings
+    return originals
+
+
+def _stop_profiling(originals: dict) -> None:
+    global _TIMINGS
+    globals().update(originals)
+    _TIMINGS = None
+
+
+def timings_writer(dest: str) -> Callable[[dict], None]:
+    """A generate_ps_doc ``timings`` callback appending JSON lines to ``dest`` ("-" = stderr)."""
+    def emit(record: dict) -> None:
+        line = json.dumps(record) + "\n"
+        if dest == "-":
+            sys.stderr.write(line)
+            sys.stderr.flush()
+        else:
+            with open(dest, "a", encoding="utf-8") as f:
+                f.write(line)
+    return emit
+
+
+def _call_with_pstats(pstats_path: str, fn, *args, **kwargs):
+    """Run ``fn`` under cProfile and dump the stats to ``pstats_path``."""
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn, *args, **kwargs)
+    finally:
+        profiler.dump_stats(pstats_path)
+
+
+# ── Granola notes index ───────────────────────────────────────────────────────
+#
+# Payloads mix Granola notes with Gong summaries of the same meetings, in
+# whatever order the caller gathered them. rank_notes() collapses duplicates
+# and picks the notes worth rendering: the most recent, with notes that mention
+# the account's use cases pulled forward. Selection is a bounded heap, so
+# thousands of notes cost one linear pass.
+
+GRANOLA_RENDER_LIMIT = 5   # notes rendered in the Granola section
+NOTE_TERM_DAYS = 30   # each use-case term a note mentions counts as this many days newer
+_NOTE_PUNCT = b"!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"
+_NOTE_FOLD = bytes.maketrans(_NOTE_PUNCT, b" " * len(_NOTE_PUNCT))
+_NOTE_STOPWORDS = frozenset((
+    "about", "across", "after", "also", "from", "have", "into", "more", "other",
+    "over", "that", "their", "them", "they", "this", "using", "when", "will", "with",
+))
+
+
+class _Note(namedtuple("_Note", "pos note day size hits")):
+    """An indexed note: first input position, the note, date ordinal, content length, use-case term hits."""
+
+
+def _note_fields(note) -> tuple[str, str, str]:
+    """(title, date, content) of a note object or plain-string note, as _granola_blocks renders them."""
+    if isinstance(note, str):
+        return "", "", note
+    content = note.get("summary") or " ".join(note.get("key_points", ()))
+    return note.get("title", ""), note.get("date") or note.get("meeting_date", ""), content
+
+
+def _words(text: str) -> list[str]:
+    # bytes.translate is several times faster than str.translate; UTF-8
+    # multi-byte sequences never contain ASCII punctuation bytes.
+    folded = text.lower().encode("utf-8", "surrogatepass").translate(_NOTE_FOLD)
+    return folded.decode("utf-8", "surrogatepass").split()
+
+
+def _day(date: str) -> int:
+    try:
+        return datetime.fromisoformat(date[:10]).toordinal()
+    except ValueError:
+        return 0
+
+
+def index_notes(notes: list, terms: frozenset[str] = frozenset()) -> list[_Note]:
+    """
+    Deduplicate notes, keeping input order, and count the ``terms`` each mentions.
+
+    Two notes are the same meeting when their normalized title and date
+    match, or when their normalized content (case, punctuation and spacing
+    folded) is identical. Of a duplicate group the note with the most
+    content is kept, at the group's first position.
+    """
+    by_meeting: dict[tuple, int] = {}
+    by_content: dict[str, int] = {}
+    index: list[_Note] = []
+    for pos, note in enumerate(notes):
+        title, date, content = _note_fields(note)
+        title_words, words, day = _words(title), _words(content), _day(date)
+        text = " ".join(words)
+        meeting = (" ".join(title_words), day or date) if title_words else None
+        slot = by_meeting.get(meeting) if meeting else None
+        if slot is None and text:
+            slot = by_content.get(text)
+        if slot is None or len(text) > index[slot].size:
+            hits = 0
+            if terms:
+                hits = len(terms.intersection(words).union(terms.intersection(title_words)))
+            if slot is None:
+                slot = len(index)
+                index.append(_Note(pos, note, day, len(text), hits))
+            else:
+                kept = index[slot]
+                index[slot] = _Note(kept.pos, note, kept.day or day, len(text), hits)
+        if meeting:
+            by_meeting.setdefault(meeting, slot)
+        if text:
+            by_content.setdefault(text, slot)
+    return index
+
+
+def _use_case_terms(acct: dict) -> frozenset[str]:
+    values = [acct.get("primary_use_case", ""), *acct.get("secondary_use_cases", ()),
+              *acct.get("chat_use_cases", ())]
+    return frozenset(w for v in values for w in _words(v)
+                     if len(w) > 3 and w not in _NOTE_STOPWORDS)
+
+
+def rank_notes(notes: list, account: dict | None = None,
+               limit: int = GRANOLA_RENDER_LIMIT) -> list:
+    """
+    The ``limit`` best notes, best first, after index_notes() deduplication.
+
+    A note scores its date (undated notes rank after dated ones) plus
+    NOTE_TERM_DAYS for every distinct use-case term of ``account``
+    (primary/secondary/chat use cases) in its title or content; ties keep
+    input order. ``notes`` and ``account`` are in normalize_data() form.
+    """
+    index = index_notes(notes, _use_case_terms(account or {}))
+    best = heapq.nlargest(limit, index, key=lambda n: (n.day + NOTE_TERM_DAYS * n.hits, -n.pos))
+    return [n.note for n in best]
+
+
+# ── Document model ────────────────────────────────────────────────────────────
+#
+# A document is composed once as a flat list of blocks — paragraphs made of
+# formatted runs, scoping tables (row specs) and page breaks — and then handed
+# to a writer backend. Sizes are in points, colours are hex strings.
+
+# namedtuples rather than dataclasses: importing dataclasses (and inspect)
+# costs ~10 ms of CLI startup.
+_Run   = namedtuple("_Run", "text bold italic size color font",
+                    defaults=(False, False, None, None, None))
+_Para  = namedtuple("_Para", "runs style center", defaults=((), None, False))
+_Table = namedtuple("_Table", "rows")
+# A numbered list kept as the caller's items, expanded by _flat() one
+# paragraph at a time: the model does not grow with the list.
+_NumberedList = namedtuple("_NumberedList", "items")
+
+
+_PAGE_BREAK = "page-break"
+_BLANK = _Para()
+
+
+def _flat(blocks):
+    """``blocks`` with each _NumberedList expanded into its list paragraphs."""
+    for block in blocks:
+        if isinstance(block, _NumberedList):
+            for item in block.items:
+                yield _list_item(str(item))
+        else:
+            yield block
+
+
+def _unpack(data: dict) -> tuple[dict, dict, dict, list, str]:
+    acct    = data.get("account", {})
+    opp     = data.get("opportunity", {})
+    demo    = data.get("demo_recap", {}) or acct.get("demo_recap", {})
+    granola = data.get("granola_notes", [])
+    sc_name = data.get("sc_name", "SC")
+    return acct, opp, demo, granola, sc_name
+
+
+def _meta_line(sc_name: str, generated: datetime) -> str:
+    return f"Generated: {generated.strftime('%B %d, %Y')}  |  SC: {sc_name}"
+
+
+def _navy_heading(text: str, level: int) -> _Para:
+    return _Para((_Run(text, color=NAVY),), style=f"Heading {level}")
+
+
+def _list_item(text: str) -> _Para:
+    return _Para((_Run(text),), style="List Number")
+
+
+def _title_blocks(account_name: str, sc_name: str, sections: list[str],
+                  generated: datetime) -> list:
+    blocks = [
+        _Para((_Run("Sales to Professional Services Handoff"),), style="Heading 1", center=True),
+        _Para((_Run(account_name, bold=True, size=14, color=NAVY),), center=True),
+        _Para((_Run(_meta_line(sc_name, generated), size=9, color=GREY),), center=True),
+        _BLANK,
+        _Para((_Run("Sections", bold=True),)),
+        _list_item("1. General Scoping — required for all Ada deals regardless of channel"),
+    ]
+    n = 1
+    for channel in ("Chat", "Email", "Voice"):
+        if channel.lower() in sections:
+            n += 1
+            blocks.append(_list_item(
+                f"{n}. {channel} Scoping — required when implementation includes {channel}"))
+    blocks.append(_BLANK)
+    return blocks
+
+
+def _next_steps_blocks(next_steps: list, demo: dict) -> list:
+    """Key next steps block rendered below the General table."""
+    blocks = [_BLANK, _navy_heading("KEY NEXT STEPS", level=2)]
+    demo_date = (demo or {}).get("date", "")
+    if demo_date:
+        blocks.append(_Para((_Run(f"From Platform Demo — {demo_date}", italic=True),)))
+    blocks.append(_NumberedList(next_steps))
+    return blocks
+
+
+def _granola_blocks(granola: list, acct: dict) -> list:
+    """Meeting notes from Granola, rendered below the next steps block (see rank_notes)."""
+    blocks = [_BLANK, _navy_heading("MEETING NOTES (from Granola)", level=2)]
+    for note in rank_notes(granola, acct):
+        if isinstance(note, dict):
+            title_txt   = note.get("title", "Meeting")
+            date_txt    = note.get("date", note.get("meeting_date", ""))
+            summary_txt = note.get("summary", "") or _fmt_list(note.get("key_points", []))
+            runs = [_Run(title_txt, bold=True, size=10)]
+            if date_txt:
+                runs.append(_Run(f" ({date_txt})", size=9))
+            blocks.append(_Para(tuple(runs)))
+            if summary_txt:
+                blocks.append(_Para((_Run(summary_txt),)))
+        else:
+            blocks.append(_Para((_Run(str(note)),)))
+    return blocks
+
+
+def _out_of_scope_notice(channel: str, notes: str = "") -> list:
+    """
+    Blocks for an out-of-scope notice rendered above a scoping table.
 
     Adds:
       1. A short blurb paragraph with any discussion notes captured during sales.
       2. A bold callout: "⚠ [Channel] is not included in the scope of this project."
     """
+    blocks = []
     if notes:
-        p = doc.add_paragraph()
-        run = p.add_run(notes)
-        run.font.size = Pt(10)
-        run.font.name = "Arial"
-        run.font.color.rgb = GREY_RGB
-
-    callout = doc.add_paragraph()
-    callout_run = callout.add_run(
+        blocks.append(_Para((_Run(notes, size=10, color=GREY, font="Arial"),)))
+    blocks.append(_Para((_Run(
         f"\u26a0\ufe0f  {channel} channel is not included in the scope of this project. "
-        "The table below is preserved for future reference — fields are left as TBD."
-    )
-    callout_run.bold = True
-    callout_run.font.size = Pt(10)
-    callout_run.font.name = "Arial"
-    callout_run.font.color.rgb = NAVY_RGB
-    doc.add_paragraph("")
+        "The table below is preserved for future reference — fields are left as TBD.",
+        bold=True, size=10, color=NAVY, font="Arial",
+    ),)))
+    blocks.append(_BLANK)
+    return blocks
 
 
-# ── Data helpers ──────────────────────────────────────────────────────────────
+def _compose(account_name: str, data: dict, sections: list[str],
+             generated: datetime) -> list[tuple[str, list]]:
+    """
+    Compose the full document model for one account.
 
-def _get(d: dict, *keys, default: str = "TBD") -> str:
-    """Safely traverse nested dicts, returning default if any key is missing."""
-    for k in keys:
-        if isinstance(d, dict):
-            d = d.get(k, default)
-        else:
-            return default
-    return d or default
+    Returns (part name, blocks) pairs in document order — "title", "general",
+    "granola", "chat", "email", "voice" — so writers can time each part separately.
+    """
+    acct, opp, demo, granola, sc_name = _unpack(data)
+    ctx = _Context(acct, opp, demo)
+    parts = [("title", _title_blocks(account_name, sc_name, sections, generated))]
 
+    # ── 1. General Scoping ────────────────────────────────────────────────────
+    if "general" in sections:
+        blocks = [_navy_heading("GENERAL SCOPING", level=1),
+                  _Table(_table_rows("general", ctx))]
 
-def _fmt_contacts(contacts) -> str:
-    if not contacts:
-        return "TBD"
-    if isinstance(contacts, str):
-        return contacts
-    if isinstance(contacts, list):
-        return "\n".join(f"• {c}" for c in contacts)
-    # dict: {"Name": "Role"}
-    return "\n".join(f"• {name} — {role}" for name, role in contacts.items())
+        next_steps = acct.get("next_steps", [])
+        if next_steps:
+            blocks += _next_steps_blocks(next_steps, demo)
+        parts.append(("general", blocks))
+        if granola:
+            parts.append(("granola", _granola_blocks(granola, acct)))
 
+    # ── 2. Chat Scoping ───────────────────────────────────────────────────────
+    if "chat" in sections:
+        blocks = [_PAGE_BREAK, _navy_heading("CHAT SCOPING", level=1), _BLANK]
 
-def _fmt_list(items, bullet: str = "•") -> str:
-    if not items:
-        return "TBD"
-    if isinstance(items, str):
-        return items
-    return "\n".join(f"{bullet} {item}" for item in items)
+        chat_scope = data.get("chat_scoping", {})
+        if chat_scope.get("out_of_scope"):
+            blocks += _out_of_scope_notice("Chat", chat_scope.get("notes", ""))
 
+        blocks.append(_Table(_table_rows("chat", ctx)))
+        parts.append(("chat", blocks))
 
-def _fmt_dict(d) -> str:
-    """Render a dict as bullet lines: '• Key: Value'."""
-    if not d:
-        return "TBD"
-    if isinstance(d, str):
-        return d
-    return "\n".join(
-        f"• {k.replace('_', ' ').title()}: {v}"
-        for k, v in d.items()
+    # ── 3. Email Scoping ──────────────────────────────────────────────────────
+    if "email" in sections:
+        blocks = [_PAGE_BREAK, _navy_heading("EMAIL SCOPING", level=1), _BLANK]
+
+        email_scope = data.get("email_scoping", {})
+        if email_scope.get("out_of_scope"):
+            blocks += _out_of_scope_notice("Email", email_scope.get("notes", ""))
+
+        blocks.append(_Table(_table_rows("email", ctx)))
+        parts.append(("email", blocks))
+
+    # ── 4. Voice Scoping ──────────────────────────────────────────────────────
+    if "voice" in sections:
+        blocks = [_PAGE_BREAK, _navy_heading("VOICE SCOPING", level=1)]
+
+        voice_scope = data.get("voice_scoping", {})
+        if voice_scope.get("out_of_scope"):
+            blocks += _out_of_scope_notice("Voice", voice_scope.get("notes", ""))
+
+        blocks.append(_Table(_table_rows("voice", ctx)))
+        parts.append(("voice", blocks))
+
+    return parts
+
+
+# ── python-docx writer ────────────────────────────────────────────────────────
+
+def _new_document() -> Document:
+    _require_docx()
+    doc = Document()
+    doc.styles["Normal"].font.name = "Arial"
+    doc.styles["Normal"].font.size = Pt(10)
+    return doc
+
+
+def _write_blocks(doc: Document, blocks: list) -> None:
+    """Append model blocks to a python-docx document."""
+    for block in _flat(blocks):
+        if block is _PAGE_BREAK:
+            doc.add_page_break()
+        elif isinstance(block, _Table):
+            _fill_table(_make_table(doc), block.rows)
+        else:
+            p = doc.add_paragraph(style=block.style)
+            if block.center:
+                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            for r in block.runs:
+                run = p.add_run(r.text)
+                if r.bold:
+                    run.bold = True
+                if r.italic:
+                    run.italic = True
+                if r.size:
+                    run.font.size = Pt(r.size)
+                if r.font:
+                    run.font.name = r.font
+                if r.color:
+                    run.font.color.rgb = RGBColor.from_string(r.color)
+
+
+def _build_document(parts: list[tuple[str, list]]) -> Document:
+    """Cold build: construct the whole document through python-docx."""
+    doc = _new_document()
+    for name, blocks in parts:
+        with _stage(name):
+            _write_blocks(doc, blocks)
+    return doc
+
+
+# ── Template skeleton cache ───────────────────────────────────────────────────
+#
+# The static parts of a document (styles, title page, section headings, header
+# rows and every fixed row of the scoping tables) only depend on which sections
+# are included. They are built once per process per section combination, then
+# deep-copied for each account: data-dependent cells are patched and blocks the
+# empty skeleton lacks (notices, next steps, notes) are inserted around tables.
+
+# key -> (skeleton document, {section: (empty-data row specs, table index in its part)})
+_SKELETONS: dict[tuple[str, ...], tuple[Document, dict[str, tuple[list[tuple], int]]]] = {}
+
+
+def _sections_key(sections: list[str]) -> tuple[str, ...]:
+    return tuple(s for s in _SECTION_ORDER if s in sections)
+
+
+def _table_at(blocks: list) -> int | None:
+    return next((i for i, b in enumerate(blocks) if isinstance(b, _Table)), None)
+
+
+def _skeleton(sections: list[str]) -> tuple[Document, dict[str, tuple[list[tuple], int]]]:
+    """Return the cached (skeleton document, table layout) for a section combination."""
+    key = _sections_key(sections)
+    if key not in _SKELETONS:
+        parts = _compose("", {}, list(key), datetime.now())
+        with _suspended_stages():
+            doc = _build_document(parts)
+        layout = {name: (blocks[at].rows, at) for name, blocks in parts
+                  if (at := _table_at(blocks)) is not None}
+        _SKELETONS[key] = (doc, layout)
+    return _SKELETONS[key]
+
+
+def _patch_table(tbl, rows: list[tuple], skeleton_rows: list[tuple]) -> None:
+    """Rewrite the value cell of every data row whose value differs from the skeleton."""
+    trs = tbl.tr_lst
+    for i, (row, base) in enumerate(zip(rows, skeleton_rows)):
+        if row[0] != "row":
+            continue
+        value = _cell_value(row[2])
+        if value != _cell_value(base[2]):
+            trs[i + 1].tc_lst[1].p_lst[0].r_lst[0].text = value
+
+
+def _insert_blocks(doc: Document, blocks: list, anchor, before: bool = False):
+    """
+    Write ``blocks`` and relocate them to sit after (or before) ``anchor``.
+
+    Returns the last element placed after ``anchor`` (``anchor`` itself when
+    inserting before it), for chaining further insertions.
+    """
+    body = doc.element.body
+    mark = len(body) - 1   # last child is always sectPr
+    _write_blocks(doc, blocks)
+    for el in list(body)[mark:len(body) - 1]:
+        if before:
+            anchor.addprevious(el)
+        else:
+            anchor.addnext(el)
+            anchor = el
+    return anchor
+
+
+def _build_from_skeleton(parts: list[tuple[str, list]]) -> Document:
+    """Warm build: clone the cached skeleton and patch in the composed parts."""
+    key = tuple(name for name, _ in parts if name in _SECTION_FIELDS)
+    with _stage("skeleton"):
+        skeleton, layout = _skeleton(key)
+        # Re-wrap the cloned part: proxies cached on the skeleton (e.g. its body)
+        # would otherwise point at detached copies of the XML.
+        part = copy.deepcopy(skeleton.part)
+        doc = DocxDocument(part.element, part)
+        body = doc.element.body
+
+    tables = dict(zip(key, body.tbl_lst))
+    anchor = None
+    for name, blocks in parts:
+        with _stage(name):
+            if name == "title":
+                # Account name and Generated/SC meta line
+                paras = body.p_lst
+                paras[1].r_lst[0].text = blocks[1].runs[0].text
+                paras[2].r_lst[0].text = blocks[2].runs[0].text
+            elif name in tables:
+                skeleton_rows, skeleton_at = layout[name]
+                at = _table_at(blocks)
+                anchor = tbl = tables[name]
+                _patch_table(tbl, blocks[at].rows, skeleton_rows)
+                if at > skeleton_at:   # e.g. an out-of-scope notice above the table
+                    _insert_blocks(doc, blocks[skeleton_at:at], tbl, before=True)
+                if at + 1 < len(blocks):   # e.g. key next steps below it
+                    anchor = _insert_blocks(doc, blocks[at + 1:], tbl)
+            else:
+                # Free-standing part (Granola notes) following the previous one
+                anchor = _insert_blocks(doc, blocks, anchor)
+    return doc
+
+
+# ── Direct OOXML writer ───────────────────────────────────────────────────────
+#
+# Emits WordprocessingML for the document model as strings, bypassing the
+# python-docx object model entirely, and packages the .docx zip itself. The
+# non-body parts (styles, numbering, settings, …) and the document.xml prologue
+# and sectPr are lifted once per process from an empty python-docx document, so
+# output matches the python-docx writer element for element.
+
+_OOXML_TEMPLATE: dict[str, object] = {}
+
+_OX_TBL_OPEN = (
+    '<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:jc w:val="center"/><w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" '
+    'w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+    '<w:tblGrid><w:gridCol w:w="4320"/><w:gridCol w:w="4320"/></w:tblGrid>'
+)
+_OX_HDR_RPR  = '<w:rPr><w:rFonts w:ascii="Arial" w:hAnsi="Arial"/><w:b/><w:color w:val="FFFFFF"/><w:sz w:val="{sz}"/></w:rPr>'
+_OX_HDR_CELL = '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{w}"/>{span}<w:shd w:fill="{fill}"/></w:tcPr><w:p><w:r/><w:r>{rpr}{text}</w:r></w:p></w:tc>'
+_OX_HDR_ROW  = "<w:tr>" + "".join(
+    _OX_HDR_CELL.format(w=w, span="", fill=NAVY, rpr=_OX_HDR_RPR.format(sz=20), text=f"<w:t>{t}</w:t>")
+    for w, t in ((3600, "Field"), (6480, "SC Input"))
+) + "</w:tr>"
+_OX_DATA_ROW = (
+    '<w:tr><w:tc><w:tcPr><w:tcW w:type="dxa" w:w="4320"/></w:tcPr><w:p><w:r><w:rPr>'
+    '<w:rFonts w:ascii="Arial" w:hAnsi="Arial"/><w:b/><w:sz w:val="18"/></w:rPr>{field}</w:r></w:p></w:tc>'
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="4320"/></w:tcPr><w:p><w:r><w:rPr>'
+    '<w:rFonts w:ascii="Arial" w:hAnsi="Arial"/><w:sz w:val="18"/></w:rPr>{value}</w:r></w:p></w:tc></w:tr>'
+)
+_OX_PAGE_BREAK = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+_OX_SPECIAL = re.compile(r"([\t\r\n])")
+
+
+def _ox_text(text: str) -> str:
+    """Run content for ``text``: <w:t> chunks split by <w:tab/> and <w:br/>, as python-docx does."""
+    out: list[str] = []
+    for chunk in _OX_SPECIAL.split(text):
+        if chunk == "\t":
+            out.append("<w:tab/>")
+        elif chunk in ("\r", "\n"):
+            out.append("<w:br/>")
+        elif chunk:
+            space = ' xml:space="preserve"' if len(chunk.strip()) < len(chunk) else ""
+            chunk = chunk.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            out.append(f"<w:t{space}>{chunk}</w:t>")
+    return "".join(out)
+
+
+def _ox_run(r: _Run) -> str:
+    props = []
+    if r.font:
+        props.append(f'<w:rFonts w:ascii="{r.font}" w:hAnsi="{r.font}"/>')
+    if r.bold:
+        props.append("<w:b/>")
+    if r.italic:
+        props.append("<w:i/>")
+    if r.color:
+        props.append(f'<w:color w:val="{r.color}"/>')
+    if r.size:
+        props.append(f'<w:sz w:val="{int(r.size * 2)}"/>')
+    inner = (f"<w:rPr>{''.join(props)}</w:rPr>" if props else "") + _ox_text(r.text)
+    return f"<w:r>{inner}</w:r>" if inner else "<w:r/>"
+
+
+def _ox_para(p: _Para) -> str:
+    ppr = ""
+    if p.style or p.center:
+        style = f'<w:pStyle w:val="{p.style.replace(" ", "")}"/>' if p.style else ""
+        jc    = '<w:jc w:val="center"/>' if p.center else ""
+        ppr = f"<w:pPr>{style}{jc}</w:pPr>"
+    inner = ppr + "".join(_ox_run(r) for r in p.runs)
+    return f"<w:p>{inner}</w:p>" if inner else "<w:p/>"
+
+
+def _ox_table(rows: list[tuple]) -> str:
+    out = [_OX_TBL_OPEN, _OX_HDR_ROW]
+    for row in rows:
+        if row[0] == "sub":
+            out.append("<w:tr>" + _OX_HDR_CELL.format(
+                w=8640, span='<w:gridSpan w:val="2"/>', fill=BLUE,
+                rpr=_OX_HDR_RPR.format(sz=20), text=_ox_text(row[1]),
+            ) + "</w:tr>")
+        else:
+            out.append(_OX_DATA_ROW.format(field=_ox_text(row[1]), value=_ox_text(_cell_value(row[2]))))
+    out.append("</w:tbl>")
+    return "".join(out)
+
+
+def _ooxml_template() -> dict[str, object]:
+    """Package parts and document.xml prologue/epilogue, captured once per process."""
+    if not _OOXML_TEMPLATE:
+        import zipfile
+
+        buf = io.BytesIO()
+        _new_document().save(buf)
+        with zipfile.ZipFile(buf) as zf:
+            parts = [(name, zf.read(name)) for name in zf.namelist()]
+        xml = dict(parts)["word/document.xml"].decode("utf-8")
+        body_start = xml.index("<w:body>") + len("<w:body>")
+        _OOXML_TEMPLATE["parts"] = parts
+        _OOXML_TEMPLATE["head"] = xml[:body_start]
+        _OOXML_TEMPLATE["tail"] = xml[xml.index("<w:sectPr"):]
+    return _OOXML_TEMPLATE
+
+
+def _ox_fragments(parts: list[tuple[str, list]]):
+    """word/document.xml for composed model parts, yielded one block at a time."""
+    tpl = _ooxml_template()
+    yield tpl["head"]
+    for name, blocks in parts:
+        with _stage(name):
+            for block in _flat(blocks):
+                if block is _PAGE_BREAK:
+                    yield _OX_PAGE_BREAK
+                elif isinstance(block, _Table):
+                    yield _ox_table(block.rows)
+                else:
+                    yield _ox_para(block)
+    yield tpl["tail"]
+
+
+def _render_ooxml(parts: list[tuple[str, list]]) -> bytes:
+    """Serialize composed model parts to a complete word/document.xml."""
+    return "".join(_ox_fragments(parts)).encode("utf-8")
+
+
+# ── Packaging ─────────────────────────────────────────────────────────────────
+#
+# The skeleton and ooxml backends only ever change word/document.xml, so their
+# other package parts come straight from the template _ooxml_template()
+# captured, never re-serialized per document (styles.xml and
+# stylesWithEffects.xml alone are ~800 KB of XML). Two knobs shape the zip:
+# the level (0 stores, 1-9 deflate) and ``slim``, which drops parts Word does
+# not need and prunes styles.xml to the styles the document references.
+
+ZIP_LEVEL = 6   # zlib's default, i.e. what python-docx writes
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)   # fixed entry timestamp for deterministic output
+
+_SLIM_DROP = ("docProps/thumbnail.jpeg", "word/stylesWithEffects.xml", "word/webSettings.xml",
+              "customXml/")
+_STYLE_REF = re.compile(rb'<w:(?:pStyle|rStyle|tblStyle) w:val="([^"]+)"')
+_STYLE_EL = re.compile(rb"<w:style [^>]*>.*?</w:style>|<w:style [^>]*/>", re.S)
+_STYLE_ID = re.compile(rb'w:styleId="([^"]+)"')
+_STYLE_DEP = re.compile(rb'<w:(?:basedOn|link|next) w:val="([^"]+)"')
+_LATENT_STYLES = re.compile(rb"<w:latentStyles[ >].*?</w:latentStyles>", re.S)
+_RELATIONSHIP = re.compile(rb'<Relationship [^>]*Target="([^"]+)"[^>]*/>')
+_OVERRIDE = re.compile(rb'<Override PartName="/([^"]+)"[^>]*/>')
+
+
+def _dropped(name: str) -> bool:
+    return name.startswith(_SLIM_DROP)
+
+
+def _slim_styles(styles_xml: bytes, used: set[bytes]) -> bytes:
+    """styles.xml without latent styles or styles unreachable from ``used`` and the defaults."""
+    styles = {}
+    keep = set(used)
+    for m in _STYLE_EL.finditer(styles_xml):
+        el = m.group()
+        sid = _STYLE_ID.search(el).group(1)
+        styles[sid] = (el, _STYLE_DEP.findall(el))
+        if b'w:default="1"' in el[:el.index(b">")]:
+            keep.add(sid)
+    todo = list(keep)
+    while todo:
+        for dep in styles.get(todo.pop(), (b"", ()))[1]:
+            if dep not in keep:
+                keep.add(dep)
+                todo.append(dep)
+    out = _STYLE_EL.sub(lambda m: m.group() if _STYLE_ID.search(m.group()).group(1) in keep else b"",
+                        styles_xml)
+    return _LATENT_STYLES.sub(b"", out)
+
+
+def _slim_rels(name: str, rels_xml: bytes) -> bytes:
+    """A .rels part without relationships to dropped parts."""
+    import posixpath
+
+    base = posixpath.dirname(posixpath.dirname(name))
+    return _RELATIONSHIP.sub(
+        lambda m: b"" if _dropped(posixpath.normpath(posixpath.join(base, m.group(1).decode())))
+        else m.group(), rels_xml)
+
+
+def _slim_parts(parts: list[tuple[str, bytes]], used: frozenset[bytes]) -> list[tuple[str, bytes]]:
+    """Package parts with _SLIM_DROP removed, references to them cut, styles pruned to ``used``."""
+    used = set(used)
+    for name, blob in parts:
+        if name == "word/numbering.xml":
+            used.update(_STYLE_REF.findall(blob))
+    slim = []
+    for name, blob in parts:
+        if _dropped(name):
+            continue
+        if name == "[Content_Types].xml":
+            blob = _OVERRIDE.sub(lambda m: b"" if _dropped(m.group(1).decode()) else m.group(), blob)
+        elif name.endswith(".rels"):
+            blob = _slim_rels(name, blob)
+        elif name == "word/styles.xml":
+            blob = _slim_styles(blob, used)
+        slim.append((name, blob))
+    return slim
+
+
+def _template_parts(document_xml: bytes, slim: bool) -> list[tuple[str, bytes]]:
+    """Template package parts for ``document_xml``."""
+    if not slim:
+        return _ooxml_template()["parts"]
+    return _slim_template(frozenset(_STYLE_REF.findall(document_xml)))
+
+
+def _slim_template(used: frozenset[bytes]) -> list[tuple[str, bytes]]:
+    """Slim template package parts for a document referencing the ``used`` styles, cached."""
+    tpl = _ooxml_template()
+    cache = tpl.setdefault("slim", {})
+    if used not in cache:
+        cache[used] = _slim_parts(tpl["parts"], used)
+    return cache[used]
+
+
+def _write_package(parts: list[tuple[str, bytes]], document_xml: bytes, dest,
+                   zip_level: int = ZIP_LEVEL, deterministic: bool = False) -> None:
+    """
+    Zip ``parts`` (with ``document_xml`` as the main part) to a path or binary file object.
+
+    ``deterministic`` pins every entry's timestamp, permissions and creating
+    system, so identical parts always produce identical bytes.
+    """
+    import zipfile
+
+    method = zipfile.ZIP_DEFLATED if zip_level else zipfile.ZIP_STORED
+    with zipfile.ZipFile(dest, "w", method, compresslevel=zip_level or None) as zf:
+        for name, blob in parts:
+            zf.writestr(_zip_entry(name, method, zip_level, deterministic),
+                        document_xml if name == "word/document.xml" else blob)
+
+
+def _zip_entry(name: str, method: int, zip_level: int, deterministic: bool):
+    """What to write ``name`` as: the bare name, or a ZipInfo with pinned metadata."""
+    if not deterministic:
+        return name
+    import zipfile
+
+    entry = zipfile.ZipInfo(name, _ZIP_EPOCH)
+    entry.compress_type = method
+    # writestr() and open() ignore the archive's level for a ZipInfo, so it is
+    # set on the entry: public as compress_level from Python 3.13, before that
+    # only the private slot the same property wraps.
+    if hasattr(zipfile.ZipInfo, "compress_level"):
+        entry.compress_level = zip_level or None
+    else:
+        entry._compresslevel = zip_level or None
+    entry.create_system = 3
+    entry.external_attr = 0o600 << 16
+    return entry
+
+
+# Every backend records a short digest of each scoping cell as rendered in
+# docProps/custom.xml ("ps-doc:<section>.<field key>" custom properties), so
+# update_ps_doc() can tell a still-generated value from a hand edit. A
+# streaming doc that capped cells into an overflow appendix also records the
+# cell limits ("ps-doc:cell-cap"): its digests are of the capped cell text,
+# and fresh values are capped the same way before they are compared.
+
+_FIELD_PROP = "ps-doc:"
+_CELL_CAP_PROP = "cell-cap"
+_CUSTOM_PROPS_CT = "application/vnd.openxmlformats-officedocument.custom-properties+xml"
+_CUSTOM_PROPS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/custom-properties"
+_CUSTOM_PROPS_NS = "http://schemas.openxmlformats.org/officeDocument/2006/custom-properties"
+_VT_NS = "http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes"
+_CUSTOM_PROPS_FMTID = "{D5CDD505-2E9C-101B-9397-08002B2CF9AE}"
+
+
+def _cell_digest(text: str) -> str:
+    import hashlib
+
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+
+
+def _field_record(parts: list[tuple[str, list]]) -> dict[str, str]:
+    """{"<section>.<field key>": digest of the rendered cell text} for the model's scoping tables."""
+    record = {}
+    for name, blocks in parts:
+        keys = {row[1]: row[3] for row in _COMPILED_SECTIONS.get(name, ()) if row[0] == "row"}
+        if not keys:
+            continue
+        for block in blocks:
+            if isinstance(block, _Table):
+                for row in block.rows:
+                    if row[0] == "row" and row[1] in keys:
+                        record[f"{name}.{keys[row[1]]}"] = _cell_digest(_cell_value(row[2]))
+    return record
+
+
+def _with_field_record(pkg: list[tuple[str, bytes]], record: dict[str, str]) -> list[tuple[str, bytes]]:
+    """Package parts plus docProps/custom.xml holding ``record``, registered in the content types and rels."""
+    props = "".join(
+        f'<property fmtid="{_CUSTOM_PROPS_FMTID}" pid="{pid}" name="{_FIELD_PROP}{name}">'
+        f"<vt:lpwstr>{digest}</vt:lpwstr></property>"
+        for pid, (name, digest) in enumerate(record.items(), 2)
     )
+    custom = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+              f'<Properties xmlns="{_CUSTOM_PROPS_NS}" xmlns:vt="{_VT_NS}">{props}</Properties>')
+    out = []
+    for name, blob in pkg:
+        if name == "[Content_Types].xml":
+            blob = blob.replace(b"</Types>", f'<Override PartName="/docProps/custom.xml" '
+                                             f'ContentType="{_CUSTOM_PROPS_CT}"/></Types>'.encode())
+        elif name == "_rels/.rels":
+            blob = blob.replace(b"</Relationships>", f'<Relationship Id="rIdPsDocFields" '
+                                                     f'Type="{_CUSTOM_PROPS_REL}" '
+                                                     f'Target="docProps/custom.xml"/></Relationships>'.encode())
+        out.append((name, blob))
+        if name == "docProps/app.xml":
+            out.append(("docProps/custom.xml", custom.encode("utf-8")))
+    return out
+
+
+class _Output(namedtuple("_Output", "backend zip_level slim deterministic",
+                         defaults=("skeleton", ZIP_LEVEL, False, False))):
+    """How writers produce their output: docx backend, zip level (0 = store), slim and deterministic packaging."""
+
+
+# ── Streaming writer ──────────────────────────────────────────────────────────
+#
+# The "streaming" backend never holds the document whole: the ooxml fragments
+# for each block go straight into the word/document.xml zip entry, buffered
+# only up to _WRITE_CHUNK, so the writer's memory stays flat however many
+# contacts, risks or next steps an account has. Table cells past
+# CELL_MAX_LINES / CELL_MAX_CHARS are cut short and continue in an overflow
+# appendix of plain paragraphs at the end of the document.
+
+CELL_MAX_LINES = 30
+CELL_MAX_CHARS = 3000
+_WRITE_CHUNK = 1 << 16
+_OVERFLOW_NOTE = " more line(s) in the appendix"
+
+
+def _cap_cell(text: str, max_lines: int = CELL_MAX_LINES,
+              max_chars: int = CELL_MAX_CHARS) -> tuple[str, int]:
+    """
+    Split cell text at the cell limits: (text shown in the cell, offset where
+    the overflow starts). The offset is len(text) when everything fits; the
+    overflow is left in ``text`` rather than copied out.
+    """
+    lines = end = 0
+    while end < len(text) and lines < max_lines:
+        nl = text.find("\n", end)
+        nl = len(text) if nl < 0 else nl
+        if nl > max_chars:
+            break
+        end, lines = nl + 1, lines + 1
+    if end >= len(text):
+        return text, len(text)
+    if not lines:
+        # One huge first line: cut it at a word boundary
+        end = text.rfind(" ", 0, max_chars) + 1 or max_chars
+    return text[:end].rstrip("\n "), end
+
+
+def _capped_cell(text: str, max_lines: int = CELL_MAX_LINES,
+                 max_chars: int = CELL_MAX_CHARS) -> str:
+    """Cell text as the streaming writer shows it: cut short, pointing to the appendix."""
+    shown, pos = _cap_cell(text, max_lines, max_chars)
+    if pos == len(text):
+        return text
+    return f"{shown}\n… {text.count(chr(10), pos) + 1}{_OVERFLOW_NOTE}"
+
+
+def _appendix_blocks(overflow: list[tuple[str, str, str, int]]):
+    """The overflow appendix, yielded one paragraph at a time from (part, field, text, offset)."""
+    yield _PAGE_BREAK
+    yield _navy_heading("APPENDIX — OVERFLOW", level=1)
+    for name, field, text, pos in overflow:
+        yield _navy_heading(f"{name.upper()} — {field}", level=2)
+        while pos < len(text):
+            nl = text.find("\n", pos)
+            nl = len(text) if nl < 0 else nl
+            yield _Para((_Run(text[pos:nl]),))
+            pos = nl + 1
+
+
+def _overflow(parts: list[tuple[str, list]]) -> list[tuple[str, list]]:
+    """
+    ``parts`` with oversized table cells capped, plus a lazily generated
+    "appendix" part holding the overflow when there is any.
+    """
+    overflow = []
+    capped = []
+    for name, blocks in parts:
+        out = []
+        for block in blocks:
+            if isinstance(block, _Table):
+                rows = []
+                for row in block.rows:
+                    if row[0] == "row":
+                        text = _cell_value(row[2])
+                        _, pos = _cap_cell(text)
+                        if pos < len(text):
+                            overflow.append((name, row[1].splitlines()[0], text, pos))
+                            row = ("row", row[1], _capped_cell(text))
+                    rows.append(row)
+                block = _Table(rows)
+            out.append(block)
+        capped.append((name, out))
+    if overflow:
+        capped.append(("appendix", _appendix_blocks(overflow)))
+    return capped
+
+
+def _model_styles(parts: list[tuple[str, list]]) -> frozenset[bytes]:
+    """Style ids the ooxml serialization of ``parts`` references, without serializing it."""
+    used = set()
+    for _, blocks in parts:
+        for block in blocks:
+            if isinstance(block, _NumberedList):
+                block = next(_flat([block]), None)
+            if isinstance(block, _Table):
+                used.add(b"TableGrid")
+            elif isinstance(block, _Para) and block.style:
+                used.add(block.style.replace(" ", "").encode())
+    return frozenset(used)
+
+
+def _stream_docx(parts: list[tuple[str, list]], dest, out: _Output) -> None:
+    """Write the .docx with word/document.xml streamed into its zip entry block by block."""
+    import zipfile
+
+    parts = _overflow(parts)
+    used = _model_styles(parts[:-1] if parts[-1][0] == "appendix" else parts)
+    if parts[-1][0] == "appendix":
+        used |= {b"Heading1", b"Heading2"}   # the appendix is generated, not scanned
+    pkg = _slim_template(used) if out.slim else _ooxml_template()["parts"]
+    record = _field_record(parts)
+    if parts[-1][0] == "appendix":
+        record[_CELL_CAP_PROP] = f"{CELL_MAX_LINES} {CELL_MAX_CHARS}"
+    pkg = _with_field_record(pkg, record)
+    method = zipfile.ZIP_DEFLATED if out.zip_level else zipfile.ZIP_STORED
+    with zipfile.ZipFile(dest, "w", method, compresslevel=out.zip_level or None) as zf:
+        for name, blob in pkg:
+            entry = _zip_entry(name, method, out.zip_level, out.deterministic)
+            if name != "word/document.xml":
+                zf.writestr(entry, blob)
+                continue
+            with zf.open(entry, "w") as fh:
+                buf, size = [], 0
+                for xml in _ox_fragments(parts):
+                    buf.append(xml)
+                    size += len(xml)
+                    if size >= _WRITE_CHUNK:
+                        fh.write("".join(buf).encode("utf-8"))
+                        buf, size = [], 0
+                fh.write("".join(buf).encode("utf-8"))
+
+
+# ── Markdown / HTML writers ───────────────────────────────────────────────────
+#
+# Text renderings of the same composed model, for the agent workflow: Markdown
+# for chat/Docs paste, HTML for Drive upload (Drive converts it to a Google
+# Doc). Navy/blue header shading and bold/italic runs carry over; sizes and
+# fonts are left to the target.
+
+_LIST_NUMBER = re.compile(r"(\d+)\. ")
+
+
+_MD_SPECIAL = re.compile(r"([\\`*_<>\[\]])")
+_MD_CELL_SPECIAL = re.compile(r"([\\`*_|<>\[\]])")
+
+
+def _md_escape(text: str, special: re.Pattern = _MD_SPECIAL) -> str:
+    return special.sub(r"\\\1", text)
+
+
+def _md_run(r: _Run) -> str:
+    text = _md_escape(r.text)
+    if r.bold and text.strip():
+        text = f"**{text}**"
+    if r.italic and text.strip():
+        text = f"*{text}*"
+    return text
+
+
+def _md_cell(text: str, bold: bool = False) -> str:
+    lines = [_md_escape(line, _MD_CELL_SPECIAL) for line in text.split("\n")]
+    if bold:
+        lines = [f"**{line}**" if line.strip() else line for line in lines]
+    return "<br>".join(lines)
+
+
+def _md_blocks(blocks: list) -> list[tuple[str, bool]]:
+    """(chunk, is_list_item) pairs; consecutive list items join with one newline."""
+    out = []
+    for block in _flat(blocks):
+        if block is _PAGE_BREAK:
+            out.append(("---", False))
+        elif isinstance(block, _Table):
+            lines = ["| Field | SC Input |", "|---|---|"]
+            for row in block.rows:
+                if row[0] == "sub":
+                    lines.append(f"| {_md_cell(row[1], bold=True)} | |")
+                else:
+                    lines.append(f"| {_md_cell(row[1], bold=True)} | {_md_cell(_cell_value(row[2]))} |")
+            out.append(("\n".join(lines), False))
+        elif block.runs:
+            text = "".join(_md_run(r) for r in block.runs).replace("\n", "  \n")
+            item = block.style == "List Number"
+            if block.style and block.style.startswith("Heading "):
+                text = "#" * int(block.style[-1]) + " " + text
+            elif item and not _LIST_NUMBER.match(text):
+                text = "1. " + text
+            out.append((text, item))
+    return out
+
+
+def _write_markdown(parts: list[tuple[str, list]], filepath: Path, out: _Output) -> None:
+    with _stage("markdown"):
+        pieces, prev_item = [], False
+        for _, blocks in parts:
+            for chunk, item in _md_blocks(blocks):
+                if pieces:
+                    pieces.append("\n" if item and prev_item else "\n\n")
+                pieces.append(chunk)
+                prev_item = item
+        filepath.write_text("".join(pieces) + "\n", encoding="utf-8")
+
+
+_HTML_CELL = "border:1px solid #999;padding:4px 6px;vertical-align:top;font-size:9pt"
+
+
+def _html_run(r: _Run, escape) -> str:
+    text = escape(r.text).replace("\n", "<br>")
+    style = []
+    if r.color:
+        style.append(f"color:#{r.color}")
+    if r.size:
+        style.append(f"font-size:{r.size:g}pt")
+    if style:
+        text = f'<span style="{";".join(style)}">{text}</span>'
+    if r.italic:
+        text = f"<em>{text}</em>"
+    if r.bold:
+        text = f"<strong>{text}</strong>"
+    return text
+
+
+def _html_table(rows: list[tuple], escape) -> str:
+    def cell(text, bold=False):
+        text = escape(text).replace("\n", "<br>")
+        return f"<strong>{text}</strong>" if bold else text
+
+    out = ['<table style="border-collapse:collapse;width:100%">',
+           f'<tr><th style="{_HTML_CELL};width:36%;background:#{NAVY};color:#{WHITE};'
+           f'text-align:left">Field</th><th style="{_HTML_CELL};background:#{NAVY};'
+           f'color:#{WHITE};text-align:left">SC Input</th></tr>']
+    for row in rows:
+        if row[0] == "sub":
+            out.append(f'<tr><td colspan="2" style="{_HTML_CELL};background:#{BLUE};'
+                       f'color:#{WHITE}">{cell(row[1], bold=True)}</td></tr>')
+        else:
+            out.append(f'<tr><td style="{_HTML_CELL}">{cell(row[1], bold=True)}</td>'
+                       f'<td style="{_HTML_CELL}">{cell(_cell_value(row[2]))}</td></tr>')
+    out.append("</table>")
+    return "\n".join(out)
+
+
+def _html_blocks(blocks: list, escape) -> list[str]:
+    out, in_list = [], False
+    for block in _flat(blocks):
+        is_item = isinstance(block, _Para) and block.style == "List Number"
+        if in_list and not is_item:
+            out.append("</ol>")
+            in_list = False
+        if block is _PAGE_BREAK:
+            out.append('<p style="page-break-before:always"></p>')
+        elif isinstance(block, _Table):
+            out.append(_html_table(block.rows, escape))
+        elif is_item:
+            if not in_list:
+                out.append("<ol>")
+                in_list = True
+            runs = list(block.runs)
+            m = _LIST_NUMBER.match(runs[0].text) if runs else None
+            value = ""
+            if m:   # section list items carry their own number
+                value = f' value="{m.group(1)}"'
+                runs[0] = runs[0]._replace(text=runs[0].text[m.end():])
+            out.append(f"<li{value}>{''.join(_html_run(r, escape) for r in runs)}</li>")
+        elif block.runs:
+            text = "".join(_html_run(r, escape) for r in block.runs)
+            tag = f"h{block.style[-1]}" if block.style and block.style.startswith("Heading ") else "p"
+            align = ' style="text-align:center"' if block.center else ""
+            out.append(f"<{tag}{align}>{text}</{tag}>")
+        else:
+            out.append("<p>&nbsp;</p>")
+    if in_list:
+        out.append("</ol>")
+    return out
+
+
+def _write_html(parts: list[tuple[str, list]], filepath: Path, out: _Output) -> None:
+    from html import escape
+
+    with _stage("html"):
+        title = escape(parts[0][1][1].runs[0].text)
+        body = [line for _, blocks in parts for line in _html_blocks(blocks, escape)]
+        filepath.write_text(
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            f"<title>PS Knowledge Transfer — {title}</title>\n</head>\n"
+            '<body style="font-family:Arial,sans-serif;font-size:10pt">\n'
+            + "\n".join(body) + "\n</body>\n</html>\n",
+            encoding="utf-8",
+        )
+
+
+# ── Render cache ──────────────────────────────────────────────────────────────
+#
+# Content-addressed: the key hashes everything that influences the output —
+# account name, normalized data payload, section set, generation date and the
+# source of this script — so unchanged accounts are served by copying the
+# previous .docx instead of rendering it again. Entries and outputs are always
+# independent files: a hard link would let an in-place save of the output
+# (python-docx ``Document.save``, a hand edit) rewrite the cached render too.
+
+CACHE_MAX_BYTES    = 2 * 1024 ** 3
+CACHE_MAX_AGE_DAYS = 30
+_CACHE_EVICT_EVERY = 256
+
+_cache_state = {"version": None, "stores": 0}
+
+
+def default_cache_dir() -> Path:
+    """Cache directory from $PS_DOC_CACHE_DIR, else $XDG_CACHE_HOME/gen-ps-doc/renders."""
+    if os.environ.get("PS_DOC_CACHE_DIR"):
+        return Path(os.environ["PS_DOC_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "gen-ps-doc" / "renders"
+
+
+def render_cache_key(account_name: str, data: dict, sections: list[str],
+                     generated: datetime, zip_level: int = ZIP_LEVEL, slim: bool = False,
+                     deterministic: bool = False, backend: str = "skeleton") -> str:
+    """Stable hex digest identifying the rendered output for these inputs."""
+    import hashlib
+
+    if _cache_state["version"] is None:
+        _cache_state["version"] = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    payload = json.dumps(
+        {
+            "version":   _cache_state["version"],
+            "account":   account_name,
+            "sections":  _sections_key(sections),
+            "generated": generated.strftime("%Y-%m-%d"),
+            "keywords":  _keyword_matcher().fingerprint,
+            "package":   [backend, zip_level, slim, deterministic],
+            "data":      data,
+        },
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _copy_into(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst`` as an independent file, replacing ``dst`` atomically."""
+    import shutil
+
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def evict_render_cache(cache_dir: str | Path,
+                       max_bytes: int = CACHE_MAX_BYTES,
+                       max_age_days: float = CACHE_MAX_AGE_DAYS) -> int:
+    """
+    Drop cache entries older than ``max_age_days``, then the least recently
+    used ones until the cache fits in ``max_bytes``.
+
+    Returns
+    -------
+    int — number of entries removed
+    """
+    entries = []
+    for f in Path(cache_dir).glob("[!.]*"):   # skip in-flight .tmp files
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, f))
+    entries.sort()   # oldest first
+
+    cutoff = time.time() - max_age_days * 86400
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for mtime, size, f in entries:
+        if mtime >= cutoff and total <= max_bytes:
+            break
+        f.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def _cache_lookup(cache_dir: Path, key: str, filepath: Path) -> bool:
+    entry = cache_dir / f"{key}{filepath.suffix}"
+    try:
+        _copy_into(entry, filepath)
+    except FileNotFoundError:
+        return False
+    os.utime(entry)   # mark as recently used for eviction
+    return True
+
+
+def _cache_store(cache_dir: Path, key: str, filepath: Path) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _copy_into(filepath, cache_dir / f"{key}{filepath.suffix}")
+    if _cache_state["stores"] % _CACHE_EVICT_EVERY == 0:
+        evict_render_cache(cache_dir)
+    _cache_state["stores"] += 1
 
 
 # ── Document generator ────────────────────────────────────────────────────────
 
+BACKENDS = ("skeleton", "docx", "ooxml", "streaming")
+
+
+def _write_docx(parts: list[tuple[str, list]], dest, out: _Output) -> None:
+    if out.backend == "streaming":
+        _stream_docx(parts, dest, out)
+        return
+    if out.backend == "ooxml":
+        document_xml = _render_ooxml(parts)
+    else:
+        doc = _build_from_skeleton(parts) if out.backend == "skeleton" else _build_document(parts)
+    with _stage("save"):
+        if out.backend != "docx":
+            if out.backend == "skeleton":
+                document_xml = doc.part.blob
+            pkg = _with_field_record(_template_parts(document_xml, out.slim), _field_record(parts))
+            _write_package(pkg, document_xml, dest, out.zip_level, out.deterministic)
+        else:
+            # The reference backend repackages python-docx's own parts
+            import zipfile
+
+            buf = io.BytesIO()
+            doc.save(buf)
+            with zipfile.ZipFile(buf) as zf:
+                pkg = [(name, zf.read(name)) for name in zf.namelist()]
+            document_xml = dict(pkg)["word/document.xml"]
+            if out.slim:
+                pkg = _slim_parts(pkg, frozenset(_STYLE_REF.findall(document_xml)))
+            pkg = _with_field_record(pkg, _field_record(parts))
+            _write_package(pkg, document_xml, dest, out.zip_level, out.deterministic)
+
+
+# Output format -> (file suffix, writer). A writer takes the composed model
+# parts, the output path and an _Output; add an entry to plug in another format.
+WRITERS: dict[str, tuple[str, Callable[[list, Path, _Output], None]]] = {
+    "docx": (".docx", _write_docx),
+    "md":   (".md",   _write_markdown),
+    "html": (".html", _write_html),
+}
+
+
+_SLUG_WORD = re.compile(r"[^\W_]+")
+
+
+def account_slug(account_name: str) -> str:
+    """
+    Filename slug for an account: its lowercased words joined by "-".
+
+    Names the slug does not spell out exactly (punctuation, repeated spaces,
+    path separators) get a short hash of the name appended, so "Acme, Inc."
+    and "Acme Inc" never overwrite each other. The same name always maps to
+    the same slug; names differing only in case are taken to be one account.
+    """
+    import hashlib
+
+    slug = "-".join(_SLUG_WORD.findall(account_name.lower()))
+    if slug.replace("-", " ") != account_name.lower():
+        digest = hashlib.sha256(account_name.encode("utf-8", "surrogatepass")).hexdigest()[:8]
+        slug = f"{slug}-{digest}" if slug else digest
+    return slug
+
+
 def generate_ps_doc(
     account_name: str,
     data: dict,
     output_dir: str | Path,
     sections: list[str] | None = None,
+    backend: str = "skeleton",
+    generated: datetime | None = None,
+    cache_dir: str | Path | None = None,
+    timings: Callable[[dict], None] | None = None,
+    formats: list[str] | None = None,
+    zip_level: int = ZIP_LEVEL,
+    slim: bool = False,
+    deterministic: bool = False,
 ) -> Path:
     """
     Generate a PS Knowledge Transfer .docx for the given account.
@@ -205,280 +2611,932 @@ def generate_ps_doc(
     account_name : str
         e.g. "Grow Therapy"
     data : dict
-        Keys: account, opportunity, demo_recap, granola_notes, sc_name
+        Keys: account, opportunity, demo_recap, granola_notes, sc_name, the
+        *_scoping sections — see DATA_SCHEMA. ValueError lists every violation.
     output_dir : str | Path
         Directory to save the .docx (created if it doesn't exist)
     sections : list[str]
-        Which sections: "general", "email", "voice". Defaults to ["general"].
+        Which sections: "general", "chat", "email", "voice". Defaults to ["general"].
+    backend : str
+        "skeleton" (default) clones a cached per-section template and patches
+        data cells; "docx" builds every element through python-docx; "ooxml"
+        writes WordprocessingML directly and packages the zip itself;
+        "streaming" writes it into the zip block by block in bounded memory,
+        moving oversized table cells into an overflow appendix.
+    generated : datetime | None
+        Date shown on the title page and in the filename. Defaults to the
+        payload's "generated" date, else now; pass a fixed date for
+        reproducible output and render-cache hits.
+    cache_dir : str | Path | None
+        Render cache directory. When set, an identical earlier render is
+        copied into place instead of building the document again.
+    timings : callable | None
+        Profiling hook. When set, the render is instrumented and the callable
+        receives one JSON-serialisable record: account, backend, sections,
+        cache ("hit" / "miss" / "partial" / "off"), total_ms and alloc_blocks, plus
+        per-stage {calls, ms, alloc_blocks} and per-helper {calls, ms}.
+        alloc_blocks is the net change in live memory blocks.
+    formats : list[str] | None
+        Output formats, from WRITERS: "docx", "md", "html". Defaults to
+        ["docx"]. The document model is composed once and every format is
+        written from it concurrently, each to the same filename stem.
+    zip_level : int
+        .docx zip compression: 0 stores entries, 1-9 deflate (default 6,
+        what python-docx writes).
+    slim : bool
+        Leave out package parts Word does not need (thumbnail,
+        stylesWithEffects, webSettings, customXml) and prune styles.xml to
+        the styles the document uses.
+    deterministic : bool
+        Byte-identical output for identical inputs: zip entries get fixed
+        timestamps and permissions. Needs a fixed date (``generated`` or the
+        payload's "generated"); ValueError otherwise.
 
     Returns
     -------
-    Path — filepath of the generated .docx
+    Path — filepath of the first requested format (the .docx by default)
     """
     if sections is None:
         sections = ["general"]
+    data = _checked(data)
+    out = _output(backend, zip_level, slim, deterministic)
+    formats = list(dict.fromkeys(formats or ["docx"]))
+    unknown = [f for f in formats if f not in WRITERS]
+    if unknown:
+        raise ValueError(f"unknown format(s) {', '.join(unknown)} (choose from {', '.join(WRITERS)})")
+    generated = _generation_date(generated, data, deterministic)
 
-    acct    = data.get("account", {})
-    opp     = data.get("opportunity", {})
-    demo    = data.get("demo_recap", {}) or acct.get("demo_recap", {})
-    granola = data.get("granola_notes", [])
-    sc_name = data.get("sc_name", "SC")
+    # ── Save ──────────────────────────────────────────────────────────────────
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem     = f"PS_Knowledge_Transfer_{account_slug(account_name)}_{generated.strftime('%Y-%m-%d')}"
+    filepaths = {fmt: out_dir / f"{stem}{WRITERS[fmt][0]}" for fmt in formats}
+
+    if timings is None:
+        _render(account_name, data, sections, out, generated, cache_dir, filepaths)
+        return filepaths[formats[0]]
+
+    recorder = _Timings()
+    originals = _start_profiling(recorder)
+    try:
+        cache = _render(account_name, data, sections, out, generated, cache_dir, filepaths)
+    finally:
+        _stop_profiling(originals)
+    timings(recorder.record(account=account_name, backend=backend,
+                            sections=list(_sections_key(sections)), formats=formats, cache=cache))
+    return filepaths[formats[0]]
+
+
+def _output(backend: str, zip_level: int, slim: bool, deterministic: bool = False) -> _Output:
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r} (choose from {', '.join(BACKENDS)})")
+    if not isinstance(zip_level, int) or not 0 <= zip_level <= 9:
+        raise ValueError(f"zip_level must be an integer 0-9, got {zip_level!r}")
+    return _Output(backend, zip_level, bool(slim), bool(deterministic))
+
+
+def _generation_date(generated: datetime | None, data: dict, deterministic: bool) -> datetime:
+    """The explicit date, else the (validated) payload's "generated", else now."""
+    if generated is not None:
+        return generated
+    if data.get("generated"):
+        return datetime.strptime(data["generated"], "%Y-%m-%d")
+    if deterministic:
+        raise ValueError("deterministic output needs a fixed date: pass generated / --date "
+                         "or set the payload's 'generated'")
+    return datetime.now()
+
+
+def render_ps_doc(
+    account_name: str,
+    data: dict,
+    sections: list[str] | None = None,
+    backend: str = "skeleton",
+    generated: datetime | None = None,
+    dest=None,
+    zip_level: int = ZIP_LEVEL,
+    slim: bool = False,
+    deterministic: bool = False,
+) -> bytes | None:
+    """
+    Render the .docx without touching the filesystem.
 
-    doc = Document()
-    doc.styles["Normal"].font.name = "Arial"
-    doc.styles["Normal"].font.size = Pt(10)
+    Takes generate_ps_doc()'s rendering arguments. With ``dest`` unset the
+    document is built in memory and returned as bytes; otherwise it is
+    written to ``dest``, a binary file object opened for writing (an upload
+    stream, say), and None is returned. The render cache is not used.
+    """
+    out = _output(backend, zip_level, slim, deterministic)
+    data = _checked(data)
+    parts = _compose(account_name, data, sections or ["general"],
+                     _generation_date(generated, data, deterministic))
+    if dest is not None:
+        _write_docx(parts, dest, out)
+        return None
+    buf = io.BytesIO()
+    _write_docx(parts, buf, out)
+    return buf.getvalue()
+
+
+def _render(account_name: str, data: dict, sections: list[str], out: _Output,
+            generated: datetime, cache_dir: str | Path | None,
+            filepaths: dict[str, Path]) -> str:
+    """Render (or fetch from cache) every requested format; returns the cache outcome."""
+    pending = dict(filepaths)
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        with _stage("cache"):
+            key = render_cache_key(account_name, data, sections, generated,
+                                   out.zip_level, out.slim, out.deterministic, out.backend)
+            pending = {fmt: path for fmt, path in filepaths.items()
+                       if not _cache_lookup(cache_dir, key, path)}
+        if not pending:
+            return "hit"
+
+    with _stage("compose"):
+        parts = _compose(account_name, data, sections, generated)
+    # Outputs left by older versions may be hard links into the render cache:
+    # never write through them
+    for path in pending.values():
+        path.unlink(missing_ok=True)
+    writes = [(WRITERS[fmt][1], path) for fmt, path in pending.items()]
+    if len(writes) == 1 or _TIMINGS is not None:
+        # Sequential while profiling so stage timings are not interleaved
+        for write, path in writes:
+            write(parts, path, out)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
 
-    # ── Title page ────────────────────────────────────────────────────────────
-    h = doc.add_heading("Sales to Professional Services Handoff", level=1)
-    h.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    sub = doc.add_paragraph()
-    sub.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    r = sub.add_run(account_name)
-    r.bold = True
-    r.font.size = Pt(14)
-    r.font.color.rgb = NAVY_RGB
-
-    meta = doc.add_paragraph()
-    meta.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    mr = meta.add_run(
-        f"Generated: {datetime.now().strftime('%B %d, %Y')}  |  SC: {sc_name}"
-    )
-    mr.font.size = Pt(9)
-    mr.font.color.rgb = GREY_RGB
-
-    doc.add_paragraph("")
-    sp = doc.add_paragraph()
-    sp.add_run("Sections").bold = True
-    doc.add_paragraph(
-        "1. General Scoping — required for all Ada deals regardless of channel",
-        style="List Number",
+        with ThreadPoolExecutor(max_workers=len(writes)) as pool:
+            for fut in [pool.submit(write, parts, path, out) for write, path in writes]:
+                fut.result()
+
+    if cache_dir is None:
+        return "off"
+    with _stage("cache"):
+        for path in pending.values():
+            _cache_store(cache_dir, key, path)
+    return "miss" if len(pending) == len(filepaths) else "partial"
+
+
+# ── Incremental update ────────────────────────────────────────────────────────
+#
+# Patches the Field / SC Input rows of an existing handoff doc in place: rows
+# are matched by their field label, and a value cell is rewritten only while it
+# still holds the text generated last time (per the docProps/custom.xml field
+# record), so hand edits survive. Everything else in the package — title page,
+# notes, other zip parts — is copied through untouched.
+
+def _placeholder(value: str) -> bool:
+    return value.startswith("TBD")
+
+
+def _tc_text(tc) -> str:
+    return "\n".join("".join(r.text for r in p.r_lst) for p in tc.p_lst)
+
+
+def _set_tc_text(tc, value: str) -> None:
+    """Replace a value cell's content, keeping its first paragraph/run formatting."""
+    from docx.oxml.ns import qn
+    from docx.text.run import Run
+
+    p = tc.p_lst[0]
+    for extra in tc.p_lst[1:]:
+        tc.remove(extra)
+    runs = p.r_lst
+    if runs:
+        r = runs[0]
+    else:
+        r = p.add_r()
+        run = Run(r, None)
+        run.font.size = Pt(9)
+        run.font.name = "Arial"
+    for child in list(p):
+        if child is not r and child.tag != qn("w:pPr"):
+            p.remove(child)
+    r.text = value
+
+
+def _read_field_record(custom_xml: bytes | None):
+    """(parsed docProps/custom.xml or None, {field: (property value element, digest)})."""
+    if custom_xml is None:
+        return None, {}
+    root = parse_xml(custom_xml)
+    record = {}
+    for prop in root.iterchildren(f"{{{_CUSTOM_PROPS_NS}}}property"):
+        name = prop.get("name", "")
+        if name.startswith(_FIELD_PROP) and len(prop):
+            record[name[len(_FIELD_PROP):]] = (prop[0], prop[0].text or "")
+    return root, record
+
+
+def update_ps_doc(path: str | Path, data: dict) -> dict:
+    """
+    Update the scoping-table values of an existing PS Knowledge Transfer .docx.
+
+    A value cell is rewritten only while it still holds the value generated
+    last time, as recorded in the doc's field record. Cells edited by hand
+    are kept: as "preserved" when the source value is unchanged too, as a
+    "conflict" when the data has moved on since. Fresh placeholder values
+    ("TBD…") never overwrite existing content. Docs rendered before field
+    records existed have none, so every changed cell there is a conflict.
+
+    Streaming docs with an overflow appendix cap long cells: fresh values are
+    capped the same way before comparing. A changed cell that overflows into the appendix, now or
+    before, is a conflict too, as the appendix is not rewritten; re-render it.
+
+    Returns
+    -------
+    dict — {"updated": [(field, old, new), …], "preserved": [field, …],
+            "conflicts": [(field, current, new), …], "unchanged": int,
+            "missing": [field, …]}
+    """
+    import zipfile
+
+    _require_docx()
+    ctx = _context(_checked(data))
+    # Labels can repeat across sections (e.g. Language Requirements), so
+    # values are resolved per section and each table is matched to a section
+    fresh = {
+        section: {row[1]: (f"{section}.{row[3]}", _cell_value(row[2](ctx)))
+                  for row in _COMPILED_SECTIONS[section] if row[0] == "row"}
+        for section in _SECTION_ORDER
+    }
+
+    path = Path(path)
+    with zipfile.ZipFile(path) as zf:
+        infos = zf.infolist()
+        parts = {info.filename: zf.read(info) for info in infos}
+    root = parse_xml(parts["word/document.xml"])
+    props, record = _read_field_record(parts.get("docProps/custom.xml"))
+    cap = record.pop(_CELL_CAP_PROP, (None, ""))[1].split()
+    limits = tuple(int(n) for n in cap) if len(cap) == 2 else None
+
+    report = {"updated": [], "preserved": [], "conflicts": [], "unchanged": 0, "missing": []}
+    recorded = False
+    for tbl in root.body.tbl_lst:
+        # Two-cell rows are Field / SC Input rows; merged headers have one cell
+        rows = [(_tc_text(tr.tc_lst[0]), tr.tc_lst[1]) for tr in tbl.tr_lst if len(tr.tc_lst) == 2]
+        labels = {label for label, _ in rows}
+        section = max(_SECTION_ORDER, key=lambda s: len(labels & fresh[s].keys()))
+        values = fresh[section]
+        if not labels & values.keys():
+            continue   # not a scoping table
+        for field, tc in rows:
+            if field not in values:
+                continue
+            key, new = values[field]
+            old = _tc_text(tc)
+            el, generated = record.get(key, (None, None))
+            spills = False
+            if limits is not None:
+                new, full = _capped_cell(new, *limits), new
+                spills = new != full or old.endswith(_OVERFLOW_NOTE)
+            if old == new:
+                report["unchanged"] += 1
+            elif _placeholder(new) or generated == _cell_digest(new):
+                report["preserved"].append(field)   # nothing new to write over the edit
+                continue
+            elif generated == _cell_digest(old) and not spills:
+                _set_tc_text(tc, new)
+                report["updated"].append((field, old, new))
+            else:
+                report["conflicts"].append((field, old, new))
+                continue
+            if el is not None and el.text != _cell_digest(new):
+                el.text = _cell_digest(new)
+                recorded = True
+        # Fields this section should contain but whose rows were not found
+        report["missing"] += [f for f in values if f not in labels]
+
+    if report["updated"] or recorded:
+        from lxml import etree
+
+        parts["word/document.xml"] = etree.tostring(root, encoding="UTF-8", standalone=True)
+        if props is not None:
+            parts["docProps/custom.xml"] = etree.tostring(props, encoding="UTF-8", standalone=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with zipfile.ZipFile(tmp, "w") as zf:
+            for info in infos:
+                zf.writestr(info, parts[info.filename])
+        os.replace(tmp, path)   # also breaks any hard link into the render cache
+    return report
+
+
+# ── Batch rendering ───────────────────────────────────────────────────────────
+
+def _load_batch_jobs(source: str | Path, sections: list[str], sc_name: str | None) -> list[dict]:
+    """
+    Expand a batch source into a list of render jobs.
+
+    ``source`` is either a JSONL manifest — one record per line with
+    ``account`` plus ``data_file`` or inline ``data``, and optional
+    ``sections`` / ``sc_name`` overrides — or a directory of per-account
+    JSON data files. For directory entries the account name is resolved in
+    the worker from ``account_name``, ``account.name`` or the file stem.
+    """
+    src = Path(source)
+    jobs: list[dict] = []
+    if src.is_dir():
+        for f in sorted(src.glob("*.json")):
+            jobs.append({"account": None, "data_file": str(f),
+                         "sections": sections, "sc_name": sc_name})
+        return jobs
+
+    with src.open(encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{src}:{lineno}: invalid JSON: {e}") from None
+            if not isinstance(rec, dict) or not ("data_file" in rec or "data" in rec):
+                raise ValueError(f"{src}:{lineno}: record needs 'data_file' or 'data'")
+            data_file = rec.get("data_file")
+            if data_file and not Path(data_file).is_absolute():
+                data_file = str(src.parent / data_file)
+            jobs.append({
+                "account":   rec.get("account"),
+                "data_file": data_file,
+                "data":      rec.get("data"),
+                "sections":  rec.get("sections") or sections,
+                "sc_name":   rec.get("sc_name") or sc_name,
+            })
+    return jobs
+
+
+def _job_label(job: dict) -> str:
+    return job.get("account") or job.get("data_file") or "<inline>"
+
+
+def _job_data(job: dict) -> tuple[str, dict]:
+    """Load a job's data and resolve its account name: (account, data)."""
+    data = job.get("data")
+    if data is None:
+        data = _read_data_file(job["data_file"], job.get("stream", False))
+    account = (
+        job.get("account")
+        or data.get("account_name")
+        or (data.get("account") or {}).get("name")
+        or Path(job["data_file"]).stem
     )
-    if "email" in sections:
-        doc.add_paragraph(
-            "2. Email Scoping — required when implementation includes Email",
-            style="List Number",
-        )
-    if "voice" in sections:
-        n = "3" if "email" in sections else "2"
-        doc.add_paragraph(
-            f"{n}. Voice Scoping — required when implementation includes Voice",
-            style="List Number",
+    return account, data
+
+
+# ── Batch journal ─────────────────────────────────────────────────────────────
+#
+# An append-only JSON-lines record of finished batch jobs:
+#
+#   {"account": "Acme", "input": "<sha256>", "path": "/out/PS_Knowledge_Transfer_acme_….docx"}
+#
+# "input" digests everything that determines a job's output — its data (file
+# bytes or inline JSON), sections, sc_name, the render options, the output
+# directory, this script and the keyword config — so a rerun skips a job only
+# if it would render the same file and the recorded output still exists. Lines are flushed as jobs
+# finish; a torn last line from a crash is ignored on the next load.
+
+def _job_digest(job: dict, output_dir: str | Path, render_opts: dict) -> str:
+    """
+    Digest of the inputs that determine ``job``'s output in ``output_dir``
+    under ``render_opts``. A data file counts by path as well as content:
+    directory jobs take their account name from it, so identical payloads
+    in two files are still two jobs.
+    """
+    import hashlib
+
+    if _cache_state["version"] is None:
+        _cache_state["version"] = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    h = hashlib.sha256()
+    opts = {k: v for k, v in render_opts.items() if k != "cache_dir"}
+    h.update(json.dumps(
+        {
+            "version":  _cache_state["version"],
+            "keywords": _keyword_matcher().fingerprint,
+            "account":  job.get("account"),
+            "sections": _sections_key(job["sections"]),
+            "sc_name":  job.get("sc_name"),
+            "options":  opts,
+            "output":   str(Path(output_dir).resolve()),
+            "file":     str(Path(job["data_file"]).resolve()) if job.get("data_file") else None,
+            "data":     job.get("data"),
+        },
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+    ).encode("utf-8"))
+    if job.get("data") is None:
+        with open(job["data_file"], "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def load_journal(path: str | Path) -> dict[str, str]:
+    """Completed jobs in a batch journal: input digest -> output path."""
+    done: dict[str, str] = {}
+    try:
+        fh = open(path, encoding="utf-8")
+    except FileNotFoundError:
+        return done
+    with fh:
+        for line in fh:
+            try:
+                rec = json.loads(line)
+                done[rec["input"]] = rec["path"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue   # torn write from an interrupted run
+    return done
+
+
+def _open_journal(path: str | Path):
+    """Open a journal for appending, first terminating a torn last line."""
+    log = open(path, "a", encoding="utf-8")
+    if log.tell():
+        with open(path, "rb") as fh:
+            fh.seek(-1, os.SEEK_END)
+            if fh.read(1) != b"\n":
+                log.write("\n")
+    return log
+
+
+def _render_job(job: dict, output_dir: str,
+                render_opts: dict) -> tuple[str, str, float, dict | None]:
+    """
+    Worker entry point: load one job's data and render it.
+
+    ``render_opts`` are extra generate_ps_doc keyword arguments (backend,
+    generated, cache_dir, formats). Returns (account, path, seconds, timings record or
+    None); the record is only collected when ``job["profile"]`` is set.
+    """
+    start = time.perf_counter()
+    _use_keywords(job.get("keywords"))
+    account, data = _job_data(job)
+    if job.get("sc_name"):
+        data["sc_name"] = job["sc_name"]
+    records = []
+    kwargs = dict(account_name=account, data=data, output_dir=output_dir,
+                  sections=job["sections"], **render_opts)
+    if job.get("profile"):
+        kwargs["timings"] = records.append
+    if job.get("pstats"):
+        filepath = _call_with_pstats(job["pstats"], generate_ps_doc, **kwargs)
+    else:
+        filepath = generate_ps_doc(**kwargs)
+    return account, str(filepath), time.perf_counter() - start, (records or [None])[0]
+
+
+def run_batch(
+    source: str | Path,
+    output_dir: str | Path,
+    sections: list[str] | None = None,
+    sc_name: str | None = None,
+    workers: int | None = None,
+    backend: str = "skeleton",
+    generated: datetime | None = None,
+    cache_dir: str | Path | None = None,
+    stream: bool = False,
+    profile: str | None = None,
+    pstats: str | None = None,
+    formats: list[str] | None = None,
+    zip_level: int = ZIP_LEVEL,
+    slim: bool = False,
+    deterministic: bool = False,
+    journal: str | Path | None = None,
+) -> int:
+    """
+    Render every account in a batch source across a process pool.
+
+    Streams one ``SUCCESS:`` / ``FAILED:`` line per account as it finishes,
+    then a ``BATCH:`` summary with aggregate throughput. With ``profile`` set,
+    each render's timings record is appended there as a JSON line ("-" =
+    stderr); with ``pstats`` set, job N's cProfile stats go to ``<pstats>.N``.
+    With ``journal`` set, finished jobs are appended to that file and jobs
+    it already records (same inputs, output still on disk) are skipped, so
+    an interrupted run resumes where it stopped.
+
+    Returns
+    -------
+    int — number of failed accounts
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    jobs = _load_batch_jobs(source, sections or ["general"], sc_name)
+    for i, job in enumerate(jobs):
+        job["stream"] = stream
+        job["keywords"] = _KEYWORDS["path"]
+        job["profile"] = profile is not None
+        if pstats:
+            job["pstats"] = f"{pstats}.{i}"
+    emit = timings_writer(profile) if profile is not None else None
+    ok = failed = 0
+    start = time.perf_counter()
+
+    render_opts = {"backend": backend, "generated": generated, "cache_dir": cache_dir,
+                   "formats": formats, "zip_level": zip_level, "slim": slim,
+                   "deterministic": deterministic}
+    total = len(jobs)
+    log = None
+    if journal is not None:
+        done = load_journal(journal)
+        pending = []
+        for job in jobs:
+            try:
+                job["input"] = _job_digest(job, output_dir, render_opts)
+            except OSError:
+                pending.append(job)   # unreadable data file: let the worker report it
+                continue
+            path = done.get(job["input"])
+            if path is None or not os.path.exists(path):
+                pending.append(job)
+        jobs = pending
+        log = _open_journal(journal)
+
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_render_job, job, str(output_dir), render_opts): job for job in jobs}
+            for fut in as_completed(futures):
+                try:
+                    account, path, secs, record = fut.result()
+                except Exception as e:  # noqa: BLE001 — report and keep going
+                    failed += 1
+                    print(f"FAILED: {_job_label(futures[fut])}: {type(e).__name__}: {e}", flush=True)
+                    continue
+                ok += 1
+                if log is not None and "input" in futures[fut]:
+                    log.write(json.dumps({"account": account, "input": futures[fut]["input"],
+                                          "path": str(Path(path).resolve())}, ensure_ascii=False) + "\n")
+                    log.flush()
+                print(f"SUCCESS: {account} -> {path} ({secs * 1000:.0f} ms)", flush=True)
+                if emit and record:
+                    emit(record)
+    finally:
+        if log is not None:
+            log.close()
+
+    elapsed = time.perf_counter() - start
+    rate = len(jobs) / elapsed if elapsed else 0.0
+    skipped = f", {total - len(jobs)} already done" if journal is not None else ""
+    print(f"BATCH: {ok}/{len(jobs)} succeeded, {failed} failed{skipped} in {elapsed:.1f}s "
+          f"({rate:.1f} docs/s, {workers} workers)", flush=True)
+    return failed
+
+
+# ── Columnar export ───────────────────────────────────────────────────────────
+#
+# One row per account holding every scoping field, resolved by the same
+# compiled field specs the documents use — python-docx is never imported and
+# no Document is built. Rows stream from the workers straight into the writer
+# (CSV, or Parquet row groups when pyarrow is installed), so memory stays flat
+# however many accounts the batch holds.
+
+EXPORT_ROW_GROUP = 4096
+_EXPORT_VOLUMES = ("chat_monthly", "email_monthly", "voice_calls_monthly",
+                   "agents", "missed_calls_pct")
+_VOLUME_GETTERS = tuple(_compile_source(f"account.key_volumes.{k}") for k in _EXPORT_VOLUMES)
+
+
+def export_columns() -> list[str]:
+    """
+    Export column names, in order: account, source, raw volumes, every
+    scoping field, then the items classified into each keyword bucket.
+    """
+    return ["account", "source", *(f"volumes.{k}" for k in _EXPORT_VOLUMES),
+            *resolve_fields({}), *(f"signals.{b}" for b in _keyword_matcher().buckets)]
+
+
+def _export_job(job: dict) -> tuple[list | None, str | None]:
+    """Worker entry point: one export row, or (None, error) — never raises."""
+    try:
+        _use_keywords(job.get("keywords"))
+        account, data = _job_data(job)
+        ctx = _context(_checked(data))
+        volumes = ["" if (v := get(ctx)) is None else v for get in _VOLUME_GETTERS]
+        signals = ["\n".join(map(str, ctx.matching(b))) for b in _keyword_matcher().buckets]
+        return [account, job.get("data_file") or "", *volumes,
+                *_resolve(ctx).values(), *signals], None
+    except Exception as e:  # noqa: BLE001 — reported by the parent, export continues
+        return None, f"{type(e).__name__}: {e}"
+
+
+class _CsvSink:
+    def __init__(self, path: Path, columns: list[str]) -> None:
+        import csv
+
+        self._fh = path.open("w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._fh)
+        self._writer.writerow(columns)
+
+    def write(self, row: list) -> None:
+        self._writer.writerow(row)
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class _ParquetSink:
+    """Buffers up to EXPORT_ROW_GROUP rows column-wise, then writes a row group."""
+
+    def __init__(self, path: Path, columns: list[str]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema([(c, pa.string()) for c in columns])
+        self._writer = pq.ParquetWriter(str(path), self._schema)
+        self._columns: list[list] = [[] for _ in columns]
+
+    def write(self, row: list) -> None:
+        for col, value in zip(self._columns, row):
+            col.append(str(value))
+        if len(self._columns[0]) >= EXPORT_ROW_GROUP:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._columns[0]:
+            self._writer.write_table(self._pa.Table.from_arrays(
+                [self._pa.array(col, self._pa.string()) for col in self._columns],
+                schema=self._schema))
+            for col in self._columns:
+                col.clear()
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+def _export_sink(path: Path, columns: list[str]):
+    if path.suffix.lower() in (".parquet", ".pq"):
+        try:
+            return path, _ParquetSink(path, columns)
+        except ImportError:
+            path = path.with_suffix(".csv")
+            print(f"WARNING: pyarrow is not installed; writing CSV to {path}", flush=True)
+    return path, _CsvSink(path, columns)
+
+
+def export_fields(
+    source: str | Path,
+    out: str | Path,
+    workers: int | None = None,
+    stream: bool = False,
+) -> tuple[Path, int, int]:
+    """
+    Resolve every account in a batch source into one columnar file.
+
+    ``source`` is a batch manifest or data directory (see _load_batch_jobs).
+    ``out`` ending in .parquet writes Parquet when pyarrow is available and
+    falls back to CSV next to it otherwise; any other suffix writes CSV.
+    Failed accounts are reported as ``FAILED:`` lines and skipped.
+
+    Returns
+    -------
+    tuple — (path written, rows exported, failed accounts)
+    """
+    jobs = _load_batch_jobs(source, list(_SECTION_ORDER), None)
+    for job in jobs:
+        job["stream"] = stream
+        job["keywords"] = _KEYWORDS["path"]
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+    columns = export_columns()
+    path, sink = _export_sink(Path(out), columns)
+    rows = failed = 0
+    try:
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            pool = ProcessPoolExecutor(max_workers=workers)
+            results = pool.map(_export_job, jobs, chunksize=max(1, min(256, len(jobs) // (workers * 4))))
+        else:
+            pool, results = None, map(_export_job, jobs)
+        try:
+            for job, (row, error) in zip(jobs, results):
+                if error:
+                    failed += 1
+                    print(f"FAILED: {_job_label(job)}: {error}", flush=True)
+                    continue
+                sink.write(row)
+                rows += 1
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    finally:
+        sink.close()
+    return path, rows, failed
+
+
+# ── Render server ─────────────────────────────────────────────────────────────
+#
+# A long-running process with python-docx imported and every skeleton prebuilt,
+# serving JSON-lines render requests over a Unix socket (or stdin/stdout):
+#
+#   → {"account": "Acme", "sections": ["general"], "data": {...},
+#      "output_dir": "/abs/path", "backend": "skeleton",
+#      "date": "2026-01-31", "cache_dir": "/abs/cache"}     (last two optional)
+#   ← {"ok": true, "path": "/abs/path/PS_Knowledge_Transfer_acme_….docx", "render_ms": 12.3}
+#   ← {"ok": false, "error": "ValueError: …"}
+#
+# The CLI transparently forwards to the server when its socket exists and
+# belongs to the current user: requests carry customer data, so a socket
+# another local user planted at the path is never spoken to.
+
+def default_socket_path() -> str:
+    """
+    Socket path from $PS_DOC_SOCKET, else one in the per-user runtime dir, or
+    without one (e.g. macOS) in a private ps-doc-<uid> directory under /tmp.
+    """
+    if os.environ.get("PS_DOC_SOCKET"):
+        return os.environ["PS_DOC_SOCKET"]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], f"ps-doc-render-{os.getuid()}.sock")
+    return os.path.join(_fallback_socket_dir(), "render.sock")
+
+
+def _fallback_socket_dir() -> str:
+    return os.path.join("/tmp", f"ps-doc-{os.getuid()}")
+
+
+def _private_dir(path: str) -> None:
+    """Create ``path`` as a 0700 directory, refusing one that is not ours alone."""
+    import stat
+
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f"{path} must be a directory only the current user can access")
+
+
+def _own_socket(path: str) -> bool:
+    """Whether ``path`` is a Unix socket owned by the current user."""
+    import stat
+
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def _warm_up() -> None:
+    """Import python-docx and prebuild every skeleton and the OOXML template."""
+    _require_docx()
+    for n in range(1, len(_SECTION_ORDER) + 1):
+        for mask in range(1 << len(_SECTION_ORDER)):
+            key = [s for i, s in enumerate(_SECTION_ORDER) if mask & (1 << i)]
+            if len(key) == n:
+                _skeleton(key)
+    _ooxml_template()
+
+
+def _handle_request(req) -> dict:
+    """Render one server request; never raises."""
+    start = time.perf_counter()
+    records = []
+    try:
+        if not isinstance(req, dict) or not req.get("account"):
+            raise ValueError("request needs 'account'")
+        data = req.get("data") or {}
+        errors = validate_data(data)
+        if errors:
+            raise ValueError("; ".join(errors))
+        _use_keywords(req.get("keywords") or _KEYWORDS["base"])
+        filepath = generate_ps_doc(
+            account_name=req["account"],
+            data=data,
+            output_dir=req.get("output_dir") or "./ps-knowledge-transfer",
+            sections=req.get("sections") or ["general"],
+            backend=req.get("backend") or "skeleton",
+            generated=_parse_date(req["date"]) if req.get("date") else None,
+            cache_dir=req.get("cache_dir"),
+            timings=records.append if req.get("profile") else None,
+            formats=req.get("formats"),
+            zip_level=req.get("zip_level", ZIP_LEVEL),
+            slim=bool(req.get("slim")),
+            deterministic=bool(req.get("deterministic")),
         )
-    doc.add_paragraph("")
+    except Exception as e:  # noqa: BLE001 — report to the client, keep serving
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    resp = {"ok": True, "path": str(filepath),
+            "render_ms": round((time.perf_counter() - start) * 1000, 2)}
+    if records:
+        resp["timings"] = records[0]
+    return resp
+
+
+def _serve_lines(rfile, wfile) -> None:
+    """Answer JSON-lines requests from ``rfile`` on ``wfile`` until EOF."""
+    for line in rfile:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            resp = {"ok": False, "error": f"invalid JSON: {e}"}
+        else:
+            resp = {"ok": True, "pong": True} if req == {"op": "ping"} else _handle_request(req)
+        wfile.write((json.dumps(resp) + "\n").encode("utf-8"))
+        wfile.flush()
 
-    # ── 1. General Scoping ────────────────────────────────────────────────────
-    if "general" in sections:
-        h1 = doc.add_heading("GENERAL SCOPING", level=1)
-        for r in h1.runs:
-            r.font.color.rgb = NAVY_RGB
-
-        t = _make_table(doc)
-
-        # Client Overview
-        overview_parts: list[str] = []
-        for field in ("platform", "hq", "founded", "funding"):
-            val = acct.get(field, "")
-            if val:
-                overview_parts.append(val if field == "platform" else f"{field.title()}: {val}")
-        drivers = acct.get("business_drivers", [])
-        if drivers:
-            overview_parts.append("\nBusiness Drivers:")
-            for d in (drivers if isinstance(drivers, list) else [drivers]):
-                overview_parts.append(f"  • {d}")
-        client_overview = "\n".join(overview_parts) or "TBD — needs discovery notes"
-
-        risks = acct.get("risks", [])
-        risk_list = risks if isinstance(risks, list) else ([risks] if risks else [])
-        next_steps = acct.get("next_steps", [])
-        arch = acct.get("key_architecture", {})
-
-        _data_row(t, "Client Overview\n\nOverview of Account + Business case with Ada", client_overview)
-        _data_row(t, "SFDC Opp", opp.get("sf_url", acct.get("salesforce_url", "TBD")))
-        _data_row(t, "Solution Survey", "TBD")
-        _data_row(t, "Key client stakeholders & Roles", _fmt_contacts(acct.get("contacts", {})))
-        _data_row(t, "Timezone", acct.get("timezone", acct.get("hq", "TBD")))
-
-        vols = acct.get("key_volumes", {})
-        _data_row(t, "Channels currently supported", _fmt_dict(vols) if vols else acct.get("current_stack", "TBD"))
-        _data_row(t, "Agent Tech Stack", acct.get("current_stack", "TBD"))
-        _data_row(t, "KB Readiness\n\nFormatted and ready for AI agent ingestion or updates required", "TBD — needs assessment")
-
-        primary_uc   = acct.get("primary_use_case", "")
-        secondary_ucs = acct.get("secondary_use_cases", [])
-        scope_parts: list[str] = []
-        if primary_uc:
-            scope_parts.append(f"Phase 1: {primary_uc}")
-        for i, uc in enumerate(secondary_ucs if isinstance(secondary_ucs, list) else [secondary_ucs]):
-            scope_parts.append(f"Phase {i + 2}: {uc}")
-        _data_row(t, "Project Scope\n\nWhat will Phase 1 include? What will Phase 2 include?",
-                  "\n\n".join(scope_parts) or "TBD")
-
-        _data_row(t, "Expected Launch Date?", opp.get("close_date", acct.get("close_date", "TBD")))
-        demo_feedback = (demo or {}).get("feedback", "")
-        _data_row(t, "Success Criteria 30 days post launch",
-                  demo_feedback or "TBD — capture during discovery/demo debrief")
-        _data_row(t, "Channels\n\nWhat channels will they plan to deploy on?",
-                  opp.get("product_channels", "") or "TBD")
-        _data_row(t, "Language Requirements", "English")
-        _data_row(t, "APIs / Personalization / Authentication Requirements",
-                  _fmt_dict(arch) if arch else "TBD")
-        _data_row(t, "Segmentation Requirements", "TBD")
-
-        # Product promises — any next step that mentions a commitment from Ada
-        promises = [
-            ns for ns in (next_steps if isinstance(next_steps, list) else [])
-            if any(kw in str(ns).lower() for kw in ["promise", "commit", "agreed", "provide", "ada to"])
-        ]
-        _data_row(t, "Product promises made to the client / FRs?",
-                  _fmt_list(promises) or "TBD — review deal notes")
-        _data_row(t, "Cluster", "• Maple")
-        _data_row(t, "Number of AI Agents", "1")
-
-        _sub_header(t, "Miscellaneous")
-        _data_row(t, "Enrolled in Ada Academy", "No (pre-signature)")
-        _data_row(t, "Security Requirements", "TBD")
-        _data_row(t, "Link + invites to Demo/Sandbox instance",
-                  (demo or {}).get("gong_call_url", "") or "TBD")
-        _data_row(t, "Pilot / Opt out", "TBD")
-        _data_row(t, "Additional Notes / Risks",
-                  _fmt_list([r for r in risk_list if "LIKELY LOST" not in str(r).upper()]) or "TBD")
-
-        # Key next steps block
-        if next_steps:
-            doc.add_paragraph("")
-            h2 = doc.add_heading("KEY NEXT STEPS", level=2)
-            for r in h2.runs:
-                r.font.color.rgb = NAVY_RGB
-            demo_date = (demo or {}).get("date", "")
-            if demo_date:
-                p = doc.add_paragraph(f"From Platform Demo — {demo_date}")
-                p.runs[0].italic = True
-            for step in (next_steps if isinstance(next_steps, list) else [next_steps]):
-                doc.add_paragraph(str(step), style="List Number")
-
-        # Meeting notes from Granola
-        if granola:
-            doc.add_paragraph("")
-            h3 = doc.add_heading("MEETING NOTES (from Granola)", level=2)
-            for r in h3.runs:
-                r.font.color.rgb = NAVY_RGB
-            for note in granola[:5]:
-                if isinstance(note, dict):
-                    title_txt   = note.get("title", "Meeting")
-                    date_txt    = note.get("date", note.get("meeting_date", ""))
-                    summary_txt = note.get("summary", "") or _fmt_list(note.get("key_points", []))
-                    p = doc.add_paragraph()
-                    run = p.add_run(title_txt)
-                    run.bold = True
-                    run.font.size = Pt(10)
-                    if date_txt:
-                        p.add_run(f" ({date_txt})").font.size = Pt(9)
-                    if summary_txt:
-                        doc.add_paragraph(summary_txt)
-                else:
-                    doc.add_paragraph(str(note))
 
-    # ── 2. Email Scoping ──────────────────────────────────────────────────────
-    if "email" in sections:
-        doc.add_page_break()
-        h = doc.add_heading("EMAIL SCOPING", level=1)
-        for r in h.runs:
-            r.font.color.rgb = NAVY_RGB
-        doc.add_paragraph("")
+def serve(socket_path: str | None = None) -> None:
+    """
+    Run the warm render server until interrupted.
 
-        email_scope = data.get("email_scoping", {})
-        if email_scope.get("out_of_scope"):
-            _out_of_scope_notice(doc, "Email", email_scope.get("notes", ""))
-
-        t2 = _make_table(doc)
-        arch = acct.get("key_architecture", {})
-
-        _sub_header(t2, "Email Architecture")
-        _data_row(t2, "Tech Stack\n\nIs the system your agents use to receive and respond to emails the same as your chat? Name the system.",
-                  acct.get("current_stack", "TBD"))
-        _data_row(t2, "Email landscape\n\nWhich email address(es) are your customers emailing?", "TBD")
-        _data_row(t2, "Webform\n\nDo you have a webform or contact form on your website?", "TBD")
-        _data_row(t2, "Custom / Filter Incoming Emails\n\nDo you want to limit incoming emails to specific use cases/topics?", "TBD")
-        _data_row(t2, "AI Agent / Human support\n\nWhich email address will the AI Agent respond as?", "TBD")
-        _data_row(t2, "Launch plan\n\nDo you require a gradual rollout?", "TBD")
-
-        _sub_header(t2, "Email Configuration")
-        _data_row(t2, "Knowledge Base\n\nAny additional sources specific to email?", "TBD")
-        _data_row(t2, "Use cases\n\nAre there any use cases unique to email vs chat/voice?", "TBD")
-        _data_row(t2, "Workflow Mapping\n\nAny notable differences in workflows for email vs chat?", "TBD")
-        _data_row(t2, "CC Support\n\nDo you need your AI Agent to support multiple email participants?", "TBD")
-        _data_row(t2, "Metadata\n\nDo you currently pass metadata about your customers to Ada?", "TBD")
-
-        _sub_header(t2, "Email Handoffs")
-        _data_row(t2, "Email / Ticketing\n\nAny differences in how AI agent hands off on email?", "TBD")
-        _data_row(t2, "Routing\n\nSpecific use cases forwarded to a separate inbox?", "TBD")
-
-        _sub_header(t2, "Additional Requirements")
-        _data_row(t2, "Authentication\n\nDo you need the AI Agent to authenticate customers via email?", "TBD")
-        _data_row(t2, "Conversation Start\n\nDo you need a workflow at the start of each email conversation?", "TBD")
-
-    # ── 3. Voice Scoping ──────────────────────────────────────────────────────
-    if "voice" in sections:
-        doc.add_page_break()
-        h = doc.add_heading("VOICE SCOPING", level=1)
-        for r in h.runs:
-            r.font.color.rgb = NAVY_RGB
+    ``socket_path`` of "-" serves JSON lines on stdin/stdout instead of a
+    Unix socket. Prints ``SERVING: <path>`` once warm and ready.
+    """
+    _warm_up()
+    _KEYWORDS["base"] = _KEYWORDS["path"]
+    if socket_path == "-":
+        print("SERVING: stdio", file=sys.stderr, flush=True)
+        _serve_lines(sys.stdin.buffer, sys.stdout.buffer)
+        return
+
+    import signal
+    import socket
+    import socketserver
+
+    path = socket_path or default_socket_path()
+    if os.path.dirname(path) == _fallback_socket_dir():
+        _private_dir(os.path.dirname(path))
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)   # stale socket from a crashed server
+        else:
+            raise OSError(f"a render server is already listening on {path}")
+        finally:
+            probe.close()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            _serve_lines(self.rfile, self.wfile)
+
+    # SIGTERM exits through the finally below so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    # Created 0600: a chmod after bind would leave the socket open to
+    # everyone for a moment
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(path, Handler)
+    finally:
+        os.umask(umask)
+    with server:
+        print(f"SERVING: {path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
 
-        voice_scope = data.get("voice_scoping", {})
-        if voice_scope.get("out_of_scope"):
-            _out_of_scope_notice(doc, "Voice", voice_scope.get("notes", ""))
-
-        t3 = _make_table(doc)
-        arch     = acct.get("key_architecture", {})
-        risks    = acct.get("risks", [])
-        risk_list = risks if isinstance(risks, list) else ([risks] if risks else [])
-
-        _sub_header(t3, "Voice Architecture")
-        _data_row(t3, "Telephony Provider", "TBD")
-        _data_row(t3, "CCaaS / Agent System\n\nWhat system do your phone agents accept calls in?", "TBD")
-        _data_row(t3, "SIP Integration Type", "TBD")
-        _data_row(t3, "Current IVR\n\nCan you share an IVR map?", "TBD")
-        _data_row(t3, "Inbound vs Outbound", "Inbound only")
-        _data_row(t3, "Call Volume",          _get(acct, "key_volumes", "voice_calls_monthly"))
-        _data_row(t3, "Current Agent Count",  _get(acct, "key_volumes", "agents"))
-        _data_row(t3, "Missed Call Rate",     _get(acct, "key_volumes", "missed_calls_pct"))
-
-        _sub_header(t3, "Voice Use Cases")
-        _data_row(t3, "Primary Voice Use Case",      acct.get("primary_use_case", "TBD"))
-        _data_row(t3, "Call Categorization / Triage", "TBD")
-        _data_row(t3, "Secondary Voice Use Cases",    _fmt_list(acct.get("secondary_use_cases", [])))
-
-        _sub_header(t3, "Voice Technical Requirements")
-        _data_row(t3, "APIs Required for Voice", _fmt_dict(arch) if arch else "TBD")
-        _data_row(t3, "DTMF / Dial Pad Input",   "TBD")
-        _data_row(t3, "SMS Capabilities",         "TBD")
-        _data_row(t3, "Cross-Channel Interoperability", "TBD")
-
-        _sub_header(t3, "Voice Handoffs")
-        _data_row(t3, "Handoff to Human Agents", "TBD")
-        _data_row(t3, "Routing Requirements",     "TBD")
-
-        _sub_header(t3, "Voice Quality & Success Criteria")
-        demo_feedback = (demo or {}).get("feedback", "")
-        _data_row(t3, "Voice Quality Feedback from Demo", demo_feedback or "TBD")
-        _data_row(t3, "Success Criteria for Voice", "TBD")
-        _data_row(t3, "Voice-Specific Risks",
-                  _fmt_list([r for r in risk_list if "LIKELY LOST" not in str(r).upper()]) or "TBD")
-        _data_row(t3, "Timeline", opp.get("close_date", acct.get("close_date", "TBD")))
 
-    # ── Save ──────────────────────────────────────────────────────────────────
-    out = Path(output_dir)
-    out.mkdir(parents=True, exist_ok=True)
-    slug     = account_name.lower().replace(" ", "-")
-    filename = f"PS_Knowledge_Transfer_{slug}_{datetime.now().strftime('%Y-%m-%d')}.docx"
-    filepath = out / filename
-    doc.save(str(filepath))
-    return filepath
+def render_via_server(request: dict, socket_path: str | None = None,
+                      timeout: float = 60.0) -> dict | None:
+    """
+    Thin client: send one render request to a running server.
+
+    Returns the server's response dict, or None when no server is listening
+    or the socket is not one the current user owns (the caller should then
+    render in-process).
+    """
+    path = socket_path or default_socket_path()
+    if not _own_socket(path):
+        return None
+
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    with sock, sock.makefile("rwb") as f:
+        f.write((json.dumps(request) + "\n").encode("utf-8"))
+        f.flush()
+        line = f.readline()
+    if not line:
+        return {"ok": False, "error": "render server closed the connection"}
+    return json.loads(line)
 
 
 # ── CLI ───────────────────────────────────────────────────────────────────────
 
+def _parse_date(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}") from None
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate a PS Knowledge Transfer .docx for an account.",
@@ -487,11 +3545,25 @@ def main() -> None:
 Examples:
   python3 ps_doc_skill.py --account "Grow Therapy" --data-file /tmp/data.json
   python3 ps_doc_skill.py --account "Acme" --sections general email --sc-name "Jane SC"
+  python3 ps_doc_skill.py --batch accounts.jsonl --workers 8
+  python3 ps_doc_skill.py --batch accounts.jsonl --journal batch.journal   # rerun to resume
+  python3 ps_doc_skill.py --batch ./data-dir/ --sections general voice
+  python3 ps_doc_skill.py --validate-only --data-file /tmp/data.json
+  python3 ps_doc_skill.py --serve            # then run the commands above as usual
+  python3 ps_doc_skill.py --batch accounts.jsonl --profile timings.jsonl --pstats render.pstats
+  python3 ps_doc_skill.py --batch ./data-dir/ --export scoping.parquet   # CSV if no pyarrow
+  python3 ps_doc_skill.py --batch accounts.jsonl --slim --zip-level 1    # small, fast saves
+  python3 ps_doc_skill.py --batch accounts.jsonl --deterministic --date 2026-01-31   # reproducible bytes
+  python3 ps_doc_skill.py --account "Acme" --data-file /tmp/data.json --formats docx md html
+  python3 ps_doc_skill.py --account "Acme" --data-file /tmp/huge.json --backend streaming
+  python3 ps_doc_skill.py --sources ./acme-dumps/ --require-sources salesforce granola
+  python3 ps_doc_skill.py --update ./ps-knowledge-transfer/PS_Knowledge_Transfer_acme_2026-01-31.docx \\
+                          --data-file /tmp/data.json
         """,
     )
-    parser.add_argument("--account",    required=True,  help="Account name (e.g. 'Grow Therapy')")
+    parser.add_argument("--account",                    help="Account name (e.g. 'Grow Therapy')")
     parser.add_argument("--sections",   nargs="+",      default=["general"],
-                        choices=["general", "email", "voice"],
+                        choices=list(_SECTION_ORDER),
                         help="Sections to include (default: general)")
     parser.add_argument("--sc-name",    default="SC",   help="SC's full name")
     parser.add_argument("--output-dir", default="./ps-knowledge-transfer",
@@ -501,17 +3573,145 @@ Examples:
     group = parser.add_mutually_exclusive_group()
     group.add_argument("--data-file", help="Path to JSON file with account/opp/etc. data")
     group.add_argument("--data-json", default="{}", help="Inline JSON string with data")
+    group.add_argument("--batch",     help="JSONL manifest or directory of JSON data files to render in bulk")
+    group.add_argument("--sources",   metavar="DIR",
+                        help="Directory of per-source JSON exports (salesforce.json, granola.json, …) "
+                             "merged in-process")
+    parser.add_argument("--require-sources", nargs="+", default=[], choices=list(INGEST_SOURCES),
+                        metavar="SOURCE",
+                        help="With --sources: fail the source count gate if any of these has 0 results")
+    parser.add_argument("--journal",  metavar="FILE",
+                        help="With --batch: record finished accounts here and skip them on rerun")
+    parser.add_argument("--export",   metavar="OUT",
+                        help="With --batch: write every account's scoping fields to one CSV/Parquet file")
+    parser.add_argument("--update",   metavar="DOCX",
+                        help="Patch changed Field/SC Input values of an existing doc in place")
+
+    parser.add_argument("--workers",  type=int, default=None,
+                        help="Worker processes for --batch (default: CPU count)")
+    parser.add_argument("--formats",  nargs="+", default=["docx"], choices=list(WRITERS),
+                        help="Output formats written from one composed model (default: docx)")
+    parser.add_argument("--backend",  default="skeleton", choices=BACKENDS,
+                        help="Rendering backend (default: skeleton)")
+    parser.add_argument("--zip-level", type=int, default=ZIP_LEVEL, choices=range(10), metavar="0-9",
+                        help=f".docx zip compression: 0 = store, 1-9 = deflate level (default: {ZIP_LEVEL})")
+    parser.add_argument("--slim",     action="store_true",
+                        help="Drop unused template parts and styles from the .docx (smaller, faster save)")
+    parser.add_argument("--date",     type=_parse_date, default=None, metavar="YYYY-MM-DD",
+                        help="Fixed generation date for the title page and filename "
+                             "(default: the payload's 'generated', else today)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Byte-identical .docx for identical inputs (needs --date or a payload 'generated')")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Render cache directory (default: $PS_DOC_CACHE_DIR or ~/.cache/gen-ps-doc/renders)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always render, bypassing the render cache")
+    parser.add_argument("--stream",   action="store_true",
+                        help="Stream data files, keeping only rendered fields (bounded memory for huge payloads)")
+    parser.add_argument("--validate-only", action="store_true",
+                        help="Check the data shape and exit without rendering (no python-docx import)")
+    parser.add_argument("--serve",    nargs="?", const="", metavar="SOCKET",
+                        help="Run a warm render server on a Unix socket ('-' for stdin/stdout)")
+    parser.add_argument("--socket",   default=None,
+                        help="Render server socket (default: $PS_DOC_SOCKET or a per-user path)")
+    parser.add_argument("--no-server", action="store_true",
+                        help="Always render in this process, even if a render server is running")
+    parser.add_argument("--keywords", metavar="JSON",
+                        help="Keyword buckets file ({bucket: [keyword, ...]}) for promises, "
+                             "blockers, security asks, integrations")
+    parser.add_argument("--profile",  nargs="?", const="-", metavar="JSONL",
+                        help="Append per-stage/per-helper render timings as JSON lines (default: stderr)")
+    parser.add_argument("--pstats",   metavar="FILE",
+                        help="Dump cProfile stats of the render to FILE (FILE.N per job with --batch)")
 
     args = parser.parse_args()
 
+    if args.keywords:
+        try:
+            load_keywords(Path(args.keywords).resolve())
+        except (OSError, ValueError) as e:
+            print(f"ERROR: invalid --keywords: {e}")
+            sys.exit(1)
+
+    if args.serve is not None:
+        try:
+            serve(args.serve or args.socket)
+        except OSError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        return
+
+    cache_dir = None if args.no_cache else str(Path(args.cache_dir or default_cache_dir()).resolve())
+
+    if args.batch and args.validate_only:
+        try:
+            jobs = _load_batch_jobs(args.batch, args.sections, None)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        invalid = 0
+        for job in jobs:
+            try:
+                data = job["data"] if job.get("data") is not None else \
+                    _read_data_file(job["data_file"], args.stream)
+                errors = validate_data(data)
+            except (OSError, ValueError) as e:
+                errors = [str(e)]
+            if errors:
+                invalid += 1
+                print(f"INVALID: {_job_label(job)}: {'; '.join(errors)}")
+        print(f"VALIDATED: {len(jobs) - invalid}/{len(jobs)} valid")
+        sys.exit(1 if invalid else 0)
+
+    if args.export:
+        if not args.batch:
+            parser.error("--export requires --batch")
+        start = time.perf_counter()
+        try:
+            path, rows, failed = export_fields(args.batch, args.export, args.workers, args.stream)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        elapsed = time.perf_counter() - start
+        print(f"EXPORT: {rows} rows -> {path}, {failed} failed in {elapsed:.1f}s "
+              f"({rows / elapsed if elapsed else 0.0:.0f} rows/s)")
+        sys.exit(1 if failed else 0)
+
+    if args.batch:
+        # Only override per-account sc_name when given explicitly on the CLI
+        sc_name = args.sc_name if args.sc_name != "SC" else None
+        try:
+            failed = run_batch(args.batch, args.output_dir, args.sections, sc_name,
+                               args.workers, args.backend, args.date, cache_dir, args.stream,
+                               args.profile, args.pstats, args.formats, args.zip_level, args.slim,
+                               args.deterministic, args.journal)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        sys.exit(1 if failed else 0)
+
+    if not args.account and not args.validate_only and not args.update and not args.sources:
+        parser.error("--account is required unless --batch, --sources or --update is given")
+
     # Load data
-    if args.data_file:
+    if args.sources:
+        try:
+            data, inventory = ingest_sources(args.sources, tuple(args.require_sources))
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        for line in source_gate_lines(inventory):
+            print(line)
+        args.account = args.account or data.get("account_name") or data.get("account", {}).get("name")
+        if not args.account and not args.validate_only and not args.update:
+            parser.error("--account is required when the sources do not name the account")
+    elif args.data_file:
         try:
-            data = json.loads(Path(args.data_file).read_text(encoding="utf-8"))
+            data = _read_data_file(args.data_file, args.stream)
         except FileNotFoundError:
             print(f"ERROR: data file not found: {args.data_file}")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"ERROR: invalid JSON in data file: {e}")
             sys.exit(1)
     else:
@@ -521,16 +3721,91 @@ Examples:
             print(f"ERROR: invalid --data-json: {e}")
             sys.exit(1)
 
-    data["sc_name"] = args.sc_name  # CLI arg takes priority
+    errors = validate_data(data)
+    if errors:
+        for err in errors:
+            print(f"ERROR: invalid data: {err}")
+        sys.exit(1)
+    if args.validate_only:
+        print(f"VALID: {args.sources or args.data_file or '--data-json'}")
+        return
+
+    # CLI arg takes priority; ingested sources keep the SFDC SC unless one is given
+    if not args.sources or args.sc_name != "SC":
+        data["sc_name"] = args.sc_name
 
-    filepath = generate_ps_doc(
+    if args.update:
+        try:
+            report = update_ps_doc(args.update, data)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"ERROR: cannot update {args.update}: {e}")
+            sys.exit(1)
+        for field, old, new in report["updated"]:
+            print(f"UPDATED: {field.splitlines()[0]}: {old!r} -> {new!r}")
+        for field in report["preserved"]:
+            print(f"PRESERVED: {field.splitlines()[0]} (manual value kept)")
+        for field, current, new in report["conflicts"]:
+            print(f"CONFLICT: {field.splitlines()[0]}: edited by hand, kept {current!r}; data now {new!r}")
+        for field in report["missing"]:
+            print(f"MISSING: {field.splitlines()[0]} (row not found)")
+        print(f"SUCCESS: {args.update} ({len(report['updated'])} updated, "
+              f"{len(report['preserved'])} preserved, {len(report['conflicts'])} conflicts, "
+              f"{report['unchanged']} unchanged)")
+        return
+
+    if args.deterministic and not args.date and not data.get("generated"):
+        parser.error("--deterministic needs --date or a 'generated' date in the payload")
+
+    emit = timings_writer(args.profile) if args.profile is not None else None
+
+    # cProfile stats can only be collected in this process
+    if not args.no_server and not args.pstats:
+        resp = render_via_server({
+            "account":    args.account,
+            "sections":   args.sections,
+            "data":       data,
+            "output_dir": str(Path(args.output_dir).resolve()),
+            "backend":    args.backend,
+            "date":       args.date.strftime("%Y-%m-%d") if args.date else None,
+            "cache_dir":  cache_dir,
+            "keywords":   _KEYWORDS["path"],
+            "formats":    args.formats,
+            "zip_level":  args.zip_level,
+            "slim":       args.slim,
+            "deterministic": args.deterministic,
+            "profile":    emit is not None,
+        }, args.socket)
+        if resp is not None:
+            if not resp.get("ok"):
+                print(f"ERROR: {resp.get('error')}")
+                sys.exit(1)
+            for fmt in args.formats:
+                print(f"SUCCESS: {Path(resp['path']).with_suffix(WRITERS[fmt][0])}")
+            if emit and resp.get("timings"):
+                emit(resp["timings"])
+            return
+
+    kwargs = dict(
         account_name=args.account,
         data=data,
         output_dir=args.output_dir,
         sections=args.sections,
+        backend=args.backend,
+        generated=args.date,
+        cache_dir=cache_dir,
+        timings=emit,
+        formats=args.formats,
+        zip_level=args.zip_level,
+        slim=args.slim,
+        deterministic=args.deterministic,
     )
+    if args.pstats:
+        filepath = _call_with_pstats(args.pstats, generate_ps_doc, **kwargs)
+    else:
+        filepath = generate_ps_doc(**kwargs)
 
-    print(f"SUCCESS: {filepath}")
+    for fmt in args.formats:
+        print(f"SUCCESS: {filepath.with_suffix(WRITERS[fmt][0])}")
 
 
 if __name__ == "__main__":
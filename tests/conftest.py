@@ -0,0 +1,7 @@
+"""Make scripts/ps_doc_skill.py importable from the tests."""
+
+import sys
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS))
@@ -0,0 +1,84 @@
+"""Batch runs: journal resume and collision-safe output names."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import ps_doc_skill as psd
+
+PAYLOAD = Path(__file__).resolve().parent / "fixtures" / "payloads" / "full.json"
+
+
+@pytest.fixture
+def manifest(tmp_path) -> Path:
+    path = tmp_path / "accounts.jsonl"
+    lines = [{"account": name, "data_file": str(PAYLOAD)} for name in ("Acme, Inc.", "Acme Inc", "Beta Co")]
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+    return path
+
+
+def _run(manifest, out, journal, capsys, **kwargs) -> str:
+    failed = psd.run_batch(manifest, out, workers=1, generated=psd.datetime(2026, 1, 31),
+                           journal=journal, **kwargs)
+    assert failed == 0
+    return capsys.readouterr().out
+
+
+def test_rerun_skips_finished_jobs(tmp_path, manifest, capsys):
+    journal = tmp_path / "batch.journal"
+    out = tmp_path / "out"
+    assert "3/3 succeeded, 0 failed, 0 already done" in _run(manifest, out, journal, capsys)
+    assert "0/0 succeeded, 0 failed, 3 already done" in _run(manifest, out, journal, capsys)
+
+    (out / "PS_Knowledge_Transfer_beta-co_2026-01-31.docx").unlink()
+    assert "1/1 succeeded, 0 failed, 2 already done" in _run(manifest, out, journal, capsys)
+
+
+def test_new_output_dir_renders_again(tmp_path, manifest, capsys):
+    journal = tmp_path / "batch.journal"
+    _run(manifest, tmp_path / "first", journal, capsys)
+    assert "3/3 succeeded" in _run(manifest, tmp_path / "second", journal, capsys)
+    assert len(list((tmp_path / "second").glob("*.docx"))) == 3
+
+
+def test_changed_options_render_again(tmp_path, manifest, capsys):
+    journal = tmp_path / "batch.journal"
+    _run(manifest, tmp_path / "out", journal, capsys)
+    assert "3/3 succeeded" in _run(manifest, tmp_path / "out", journal, capsys, slim=True)
+
+
+def test_torn_journal_line_is_ignored(tmp_path, manifest, capsys):
+    journal = tmp_path / "batch.journal"
+    _run(manifest, tmp_path / "out", journal, capsys)
+    with journal.open("a", encoding="utf-8") as fh:
+        fh.write('{"account": "x", "inp')
+    assert "3 already done" in _run(manifest, tmp_path / "out", journal, capsys)
+    assert len(psd.load_journal(journal)) == 3
+
+
+def test_identical_payloads_in_a_directory_are_separate_jobs(tmp_path, capsys):
+    data = json.loads(PAYLOAD.read_text(encoding="utf-8"))
+    data.pop("account_name", None)
+    data["account"].pop("name", None)   # named after the file, then
+    accounts = tmp_path / "accounts"
+    accounts.mkdir()
+    for name in ("alpha", "beta"):
+        (accounts / f"{name}.json").write_text(json.dumps(data), encoding="utf-8")
+    journal, out = tmp_path / "batch.journal", tmp_path / "out"
+    _run(accounts, out, journal, capsys)
+    alpha, = out.glob("*_alpha_*.docx")
+
+    alpha.unlink()
+    assert "1/1 succeeded, 0 failed, 1 already done" in _run(accounts, out, journal, capsys)
+    assert alpha.exists()
+
+
+def test_account_slugs_do_not_collide():
+    names = ["Acme, Inc.", "Acme Inc", "Acme-Inc", "Acme  Inc", "A/B Co"]
+    slugs = [psd.account_slug(name) for name in names]
+    assert len(set(slugs)) == len(names)
+    assert psd.account_slug("Acme Inc") == "acme-inc"
+    assert psd.account_slug("Grow Therapy") == "grow-therapy"
+    assert all("/" not in slug for slug in slugs)
+    assert psd.account_slug("Acme, Inc.") == psd.account_slug("Acme, Inc.")
@@ -0,0 +1,46 @@
+"""Render cache: hits are served as independent copies of the cached render."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from docx import Document
+
+import ps_doc_skill as psd
+
+PAYLOAD = Path(__file__).resolve().parent / "fixtures" / "payloads" / "full.json"
+SECTIONS = ["general", "chat", "email", "voice"]
+
+
+def _render(out: Path, cache: Path) -> Path:
+    data = json.loads(PAYLOAD.read_text(encoding="utf-8"))
+    return psd.generate_ps_doc("Acme Health", data, out, SECTIONS,
+                               generated=datetime(2026, 1, 31), cache_dir=cache)
+
+
+def _texts(path: Path) -> list[str]:
+    return [p.text for p in Document(str(path)).paragraphs]
+
+
+def test_in_place_save_does_not_reach_the_cache(tmp_path):
+    cache = tmp_path / "cache"
+    first = _render(tmp_path / "first", cache)
+    doc = Document(str(first))
+    doc.add_paragraph("hand edit")
+    doc.save(str(first))
+
+    second = _render(tmp_path / "second", cache)
+    assert "hand edit" in _texts(first)
+    assert "hand edit" not in _texts(second)
+    assert "hand edit" not in _texts(_render(tmp_path / "first", cache))   # a hit replaces the edited output
+
+
+def test_hits_do_not_share_the_cache_entry(tmp_path):
+    cache = tmp_path / "cache"
+    _render(tmp_path / "first", cache)
+    hit = _render(tmp_path / "second", cache)
+    entries = list(cache.glob("*.docx"))
+    assert len(entries) == 1
+    assert entries[0].stat().st_nlink == 1
+    assert hit.stat().st_nlink == 1
+    assert not list(cache.glob(".*")) and not list(hit.parent.glob(".*"))
@@ -0,0 +1,66 @@
+"""
+Golden-file comparison: every backend must render the fixed payloads in
+tests/fixtures/payloads/ to exactly the package parts checked in under
+tests/golden/<payload>[-slim]/ — word/document.xml byte for byte, every
+other part by name, order and sha256.
+
+After an intentional output change, regenerate the golden files with
+
+    PS_DOC_UPDATE_GOLDEN=1 python -m pytest tests/test_golden.py
+
+and review the document.xml diff.
+"""
+
+import hashlib
+import io
+import json
+import os
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import ps_doc_skill as psd
+
+HERE = Path(__file__).resolve().parent
+PAYLOADS = HERE / "fixtures" / "payloads"
+GOLDEN = HERE / "golden"
+SECTIONS = ["general", "chat", "email", "voice"]
+GENERATED = datetime(2026, 1, 31)
+UPDATE = os.environ.get("PS_DOC_UPDATE_GOLDEN") == "1"
+CASES = sorted(p.stem for p in PAYLOADS.glob("*.json"))
+
+
+def _render(case: str, backend: str, slim: bool) -> bytes:
+    data = json.loads((PAYLOADS / f"{case}.json").read_text(encoding="utf-8"))
+    return psd.render_ps_doc("Acme Health", data, SECTIONS, backend=backend, generated=GENERATED,
+                             slim=slim, deterministic=True)
+
+
+def _parts(blob: bytes) -> dict[str, bytes]:
+    with zipfile.ZipFile(io.BytesIO(blob)) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+@pytest.mark.parametrize("slim", [False, True], ids=["default", "slim"])
+@pytest.mark.parametrize("backend", psd.BACKENDS)
+@pytest.mark.parametrize("case", CASES)
+def test_parts_match_golden(case, backend, slim):
+    parts = _parts(_render(case, backend, slim))
+    manifest = {name: hashlib.sha256(blob).hexdigest() for name, blob in parts.items()}
+    golden = GOLDEN / (f"{case}-slim" if slim else case)
+    if UPDATE:
+        golden.mkdir(parents=True, exist_ok=True)
+        (golden / "document.xml").write_bytes(parts["word/document.xml"])
+        (golden / "parts.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    assert parts["word/document.xml"] == (golden / "document.xml").read_bytes()
+    expected = json.loads((golden / "parts.json").read_text(encoding="utf-8"))
+    assert list(manifest) == list(expected)
+    assert manifest == expected
+
+
+@pytest.mark.parametrize("backend", psd.BACKENDS)
+def test_deterministic_bytes(backend):
+    assert _render("full", backend, False) == _render("full", backend, False)
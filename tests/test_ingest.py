@@ -0,0 +1,94 @@
+"""Source ingestion from local per-source exports standing in for the live services."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+import ps_doc_skill as psd
+
+SOURCES = Path(__file__).resolve().parent / "fixtures" / "sources"
+
+
+@pytest.fixture(scope="module")
+def complete():
+    return psd.ingest_sources(SOURCES / "complete")
+
+
+def test_records_deduplicated_by_id_and_date(complete):
+    data, _ = complete
+    notes = [(n["id"], n["date"]) for n in data["granola_notes"]]
+    # g2 appears in both dumps on the same date: one entry. g4 on two dates: two.
+    assert notes == [("g4", "2026-09-22"), ("g3", "2026-09-15"), ("g4", "2026-09-08"),
+                     ("g2", "2026-09-01"), ("g1", "2026-08-01")]
+    assert len(data["gong_calls"]) == 1
+
+
+def test_duplicates_fill_in_empty_fields(complete):
+    data, _ = complete
+    demo = next(n for n in data["granola_notes"] if n["id"] == "g2")
+    assert demo["summary"] == "Demo went well"          # empty in granola.json
+    assert demo["key_points"] == ["Voice", "Email"]     # not replaced by the empty copy
+    assert data["gong_calls"][0]["transcript"] == "Full transcript"
+
+
+def test_split_dumps_are_merged(complete):
+    data, inventory = complete
+    assert "g3" in {n["id"] for n in data["granola_notes"]}   # only in granola-2.json
+    assert [title for title, _, _ in inventory["granola"]] == [
+        "Weekly sync", "Scoping", "Weekly sync", "Demo", "Discovery"]
+
+
+def test_salesforce_fields_lifted(complete):
+    data, inventory = complete
+    assert data["sc_name"] == "Jane SC"
+    assert "sc_name" not in data["opportunity"]
+    assert inventory["salesforce"] == [("Acme Health - New Business", "2026-12-01", "https://sf.example/opp/1")]
+
+
+def test_channel_scope_defaults_from_product_channels(complete):
+    data, _ = complete
+    assert data["chat_scoping"]["out_of_scope"] is False    # "Messaging"
+    assert data["email_scoping"]["out_of_scope"] is True    # not sold
+    # Voice is sold, but the scoping export's explicit flag wins
+    assert data["voice_scoping"] == {"out_of_scope": True, "notes": "Voice deferred to phase 2"}
+
+
+def test_sparse_sources_and_defaults():
+    data, inventory = psd.ingest_sources(SOURCES / "sparse")
+    assert inventory["granola"] == inventory["gmail"] == inventory["gong"] == []
+    assert data["email_scoping"]["out_of_scope"] is False
+    assert data["chat_scoping"]["out_of_scope"] is True
+    assert data["voice_scoping"]["out_of_scope"] is True
+
+
+def test_require_gate_fails_on_empty_source():
+    with pytest.raises(ValueError, match=r"source count gate: 0 results from 1c Granola meetings, 1d Gong"):
+        psd.ingest_sources(SOURCES / "sparse", require=("granola", "gong"))
+
+
+def test_require_gate_passes_when_sources_have_results():
+    psd.ingest_sources(SOURCES / "complete", require=("salesforce", "granola", "gong", "gmail"))
+
+
+def test_require_rejects_unknown_sources():
+    with pytest.raises(ValueError, match="unknown source"):
+        psd.ingest_sources(SOURCES / "complete", require=("slack",))
+
+
+def test_missing_directory():
+    with pytest.raises(ValueError, match="sources directory not found"):
+        psd.ingest_sources(SOURCES / "nope")
+
+
+def test_async_matches_sync(complete):
+    assert asyncio.run(psd.ingest_sources_async(SOURCES / "complete")) == complete
+
+
+def test_gate_lines():
+    _, inventory = psd.ingest_sources(SOURCES / "sparse")
+    lines = psd.source_gate_lines(inventory)
+    assert lines[:3] == ["✅ 1a Salesforce opportunity — 1 found:",
+                         "  1. Acme Health - New Business",
+                         "⚠️ 1b Account context — 0 results returned"]
+    assert "⚠️ 1c Granola meetings — 0 results returned" in lines
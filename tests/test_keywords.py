@@ -0,0 +1,76 @@
+"""Keyword signals: word-start matching, prefix keywords, --keywords files."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import ps_doc_skill as psd
+from conftest import SCRIPTS
+
+PAYLOAD = Path(__file__).resolve().parent / "fixtures" / "payloads" / "full.json"
+
+
+@pytest.fixture(autouse=True)
+def default_keywords():
+    yield
+    psd.load_keywords(None)
+
+
+@pytest.fixture
+def data() -> dict:
+    return json.loads(PAYLOAD.read_text(encoding="utf-8"))
+
+
+def test_keywords_match_at_word_start():
+    matcher = psd.KeywordMatcher(psd.DEFAULT_KEYWORDS)
+    assert "promises" not in matcher.classify("Canada to confirm rollout region")
+    assert "promises" in matcher.classify("Ada to confirm rollout region")
+    assert "promises" in matcher.classify("Written commitment on the roadmap item")
+    assert matcher.classify("Nothing to see here") == frozenset()
+
+
+def test_prefix_keyword_credits_every_bucket():
+    matcher = psd.KeywordMatcher({"audit": ("soc",), "security": ("soc 2",), "other": ("socks",)})
+    assert matcher.classify("Send the SOC 2 report") == {"audit", "security"}
+    assert matcher.classify("Send the SOC report") == {"audit"}
+    assert matcher.classify("Wool socks") == {"audit", "other"}
+
+
+def test_equal_bucket_sets_are_shared():
+    matcher = psd.KeywordMatcher(psd.DEFAULT_KEYWORDS)
+    (_, a), (_, b) = matcher.classify_items(["SSO via Okta", "SAML and the Salesforce API"])
+    assert a == {"security", "integrations"}
+    assert a is b
+
+
+def test_keywords_file_replaces_and_extends_buckets(tmp_path):
+    path = tmp_path / "keywords.json"
+    path.write_text(json.dumps({"security": ["badge access"], "legal": ["msa"]}), encoding="utf-8")
+    matcher = psd.load_keywords(path)
+    assert matcher.classify("SSO rollout") == frozenset()          # replaced
+    assert matcher.classify("Badge access review") == {"security"}
+    assert matcher.classify("MSA redlines") == {"legal"}             # added
+    assert matcher.classify("Ada to provide a sandbox") == {"promises"}   # untouched
+
+
+def test_keywords_file_must_be_bucket_lists(tmp_path):
+    path = tmp_path / "keywords.json"
+    path.write_text(json.dumps({"security": "sso"}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        psd.load_keywords(path)
+    proc = subprocess.run([sys.executable, str(SCRIPTS / "ps_doc_skill.py"), "--keywords", str(path)],
+                          capture_output=True, text=True)
+    assert proc.returncode == 1
+    assert "ERROR: invalid --keywords" in proc.stdout
+
+
+def test_security_requirements_come_from_signals(data):
+    fields = psd.resolve_fields(data, ["general"])
+    assert fields["general.security"] == "• Ada to provide SOC2 report"
+    assert "Ada to provide SOC2 report" in fields["general.promises"]
+
+    data["account"]["next_steps"] = ["Schedule technical deep dive"]
+    assert psd.resolve_fields(data, ["general"])["general.security"] == "TBD"
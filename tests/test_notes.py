@@ -0,0 +1,57 @@
+"""Granola notes: index_notes() collapses duplicates, rank_notes() picks the ones to render."""
+
+import ps_doc_skill as psd
+
+
+def note(title, date, summary):
+    return {"title": title, "date": date, "summary": summary}
+
+
+def test_same_title_and_date_is_one_meeting():
+    notes = [note("Kickoff call", "2024-03-01", "Short."),
+             note("Other", "2024-03-02", "Unrelated."),
+             note("kickoff  CALL!", "2024-03-01T10:00", "Longer notes of the same kickoff call.")]
+    index = psd.index_notes(notes)
+    assert [n.note for n in index] == [notes[2], notes[1]]   # richest copy, first position
+    assert index[0].pos == 0
+
+
+def test_same_title_on_another_day_is_another_meeting():
+    notes = [note("Weekly sync", "2024-03-01", "a"), note("Weekly sync", "2024-03-08", "b")]
+    assert len(psd.index_notes(notes)) == 2
+
+
+def test_same_content_is_one_meeting():
+    notes = ["Discussed SSO, and the rollout plan.",
+             note("Gong: Acme sync", "2024-03-01", "discussed sso and the   rollout plan"),
+             note("Acme sync notes", "", "Discussed SSO and the rollout plan — with extra detail.")]
+    index = psd.index_notes(notes)
+    assert [n.note for n in index] == [notes[0], notes[2]]
+
+
+def test_richest_copy_keeps_group_date():
+    notes = [note("Demo", "2024-03-01", "Short."), note("Demo", "2024-03-01", "Much longer demo notes.")]
+    (kept,) = psd.index_notes(notes)
+    assert kept.note is notes[1]
+    assert kept.day == psd._day("2024-03-01")
+
+
+def test_newest_first_and_undated_last():
+    notes = [note("Undated", "", "x"), note("Old", "2024-01-01", "y"),
+             "plain string note", note("New", "2024-06-01", "z")]
+    ranked = psd.rank_notes(notes)
+    assert [psd._note_fields(n)[0] for n in ranked] == ["New", "Old", "Undated", ""]
+
+
+def test_ties_keep_input_order():
+    notes = [note(f"Meeting {i}", "2024-03-01", f"notes {i}") for i in range(8)]
+    assert psd.rank_notes(notes) == notes[:psd.GRANOLA_RENDER_LIMIT]
+    assert psd.rank_notes(notes, limit=3) == notes[:3]
+
+
+def test_use_case_terms_pull_notes_forward():
+    notes = [note("Recent", "2024-03-10", "Pricing discussion."),
+             note("Older", "2024-03-01", "Walked through the chatbot deflection flows.")]
+    account = {"primary_use_case": "Chatbot deflection"}
+    assert psd.rank_notes(notes) == notes
+    assert psd.rank_notes(notes, account) == notes[::-1]
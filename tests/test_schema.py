@@ -0,0 +1,102 @@
+"""DATA_SCHEMA: normalize_data() brings payloads to canonical form and reports every problem."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import ps_doc_skill as psd
+
+PAYLOAD = Path(__file__).resolve().parent / "fixtures" / "payloads" / "full.json"
+
+
+def normalized(data: dict) -> dict:
+    data, errors = psd.normalize_data(data)
+    assert errors == []
+    return data
+
+
+def test_schema_compiles_after_import():
+    # The schema node types must not be shadowed by later module-level names.
+    errors = []
+    assert psd._compile_schema(psd.DATA_SCHEMA)({"account": {"risks": "churn"}}, "", errors) \
+        == {"account": {"risks": ["churn"]}}
+    assert errors == []
+
+
+def test_full_payload_is_valid():
+    data = json.loads(PAYLOAD.read_text(encoding="utf-8"))
+    assert psd.validate_data(data) == []
+
+
+def test_bare_value_is_a_one_item_list():
+    acct = normalized({"account": {"risks": "Budget freeze", "languages": "French"}})["account"]
+    assert acct == {"risks": ["Budget freeze"], "languages": ["French"]}
+
+
+def test_numbers_become_strings():
+    data = normalized({"account": {"founded": 2020, "next_steps": [1, 2.5]},
+                       "opportunity": {"close_date": 20260131}})
+    assert data["account"] == {"founded": "2020", "next_steps": ["1", "2.5"]}
+    assert data["opportunity"] == {"close_date": "20260131"}
+    # key_volumes are scalars: numbers stay numbers
+    assert normalized({"account": {"key_volumes": {"agents": 45}}})["account"]["key_volumes"] == {"agents": 45}
+
+
+@pytest.mark.parametrize("contacts", [
+    {"Jane Doe": "VP Support", "Bob Roe": "IT Lead"},
+    [{"name": "Jane Doe", "role": "VP Support"}, {"name": "Bob Roe", "title": "IT Lead"}],
+    ["Jane Doe — VP Support", "Bob Roe — IT Lead"],
+])
+def test_contacts_become_name_and_role(contacts):
+    assert normalized({"account": {"contacts": contacts}})["account"]["contacts"] \
+        == ["Jane Doe — VP Support", "Bob Roe — IT Lead"]
+
+
+def test_contact_without_role():
+    contacts = [{"name": "Jane Doe"}, "Bob Roe"]
+    assert normalized({"account": {"contacts": contacts}})["account"]["contacts"] == ["Jane Doe", "Bob Roe"]
+    assert normalized({"account": {"contacts": {"Jane Doe": None}}})["account"]["contacts"] == ["Jane Doe"]
+
+
+def test_null_is_missing():
+    data = normalized({"account_name": None, "account": {"hq": None, "risks": None,
+                                                         "key_volumes": {"chat": None, "agents": 3}}})
+    assert data == {"account": {"key_volumes": {"agents": 3}}}
+    assert psd.resolve_fields({"account": {"hq": None}}, ["general"])["general.timezone"] == "TBD"
+
+
+def test_input_is_not_modified():
+    data = {"account": {"risks": "Budget freeze", "founded": 2020}}
+    normalized(data)
+    assert data == {"account": {"risks": "Budget freeze", "founded": 2020}}
+
+
+def test_every_error_is_reported_with_its_path():
+    errors = psd.validate_data({
+        "generated": "31/01/2026",
+        "account": {"hq": ["New York"], "risks": {"a": 1}, "key_volumes": {"agents": True},
+                    "next_steps": ["ok", {"x": 1}], "contacts": [{"name": "Jane"}, 3.5, False]},
+        "opportunity": "n/a",
+        "granola_notes": {"title": "Kickoff"},
+        "chat_scoping": {"out_of_scope": "yes"},
+    })
+    assert errors == [
+        "generated: expected YYYY-MM-DD date, got '31/01/2026'",
+        "account.hq: expected string, got array",
+        "account.risks: expected array, got object",
+        "account.next_steps[1]: expected string, got object",
+        "account.key_volumes.agents: expected string or number, got boolean",
+        "account.contacts[2]: expected string, got boolean",
+        "opportunity: expected object, got string",
+        "granola_notes: expected array, got object",
+        "chat_scoping.out_of_scope: expected boolean, got string",
+    ]
+    with pytest.raises(ValueError, match="invalid data: generated: .*; account.hq: "):
+        psd.resolve_fields({"generated": "31/01/2026", "account": {"hq": ["New York"]}})
+
+
+def test_granola_notes_accept_strings_and_objects():
+    notes = normalized({"granola_notes": ["Plain note", {"title": "Kickoff", "key_points": "One point"}]})
+    assert notes["granola_notes"] == ["Plain note", {"title": "Kickoff", "key_points": ["One point"]}]
+    assert psd.validate_data({"granola_notes": "Plain note"}) == ["granola_notes: expected array, got string"]
@@ -0,0 +1,70 @@
+"""Render server: the socket is private to its user, and clients only talk to their own."""
+
+import os
+import socket
+import stat
+import subprocess
+import sys
+
+import pytest
+
+import ps_doc_skill as psd
+from conftest import SCRIPTS
+
+
+@pytest.fixture
+def server(tmp_path):
+    """A render server on a socket in ``tmp_path``; yields the socket path."""
+    path = str(tmp_path / "render.sock")
+    proc = subprocess.Popen([sys.executable, str(SCRIPTS / "ps_doc_skill.py"), "--serve", path],
+                            stdout=subprocess.PIPE, text=True)
+    try:
+        assert proc.stdout.readline().strip() == f"SERVING: {path}"
+        yield path
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+def test_socket_is_created_private(server):
+    assert stat.S_IMODE(os.stat(server).st_mode) == 0o600
+    assert psd.render_via_server({"op": "ping"}, server) == {"ok": True, "pong": True}
+
+
+def test_client_ignores_what_is_not_a_socket(tmp_path):
+    path = tmp_path / "render.sock"
+    path.write_text("")
+    assert psd.render_via_server({"op": "ping"}, str(path)) is None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="needs root to chown")
+def test_client_ignores_another_users_socket(tmp_path):
+    path = str(tmp_path / "render.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen()
+    try:
+        os.chown(path, 65534, -1)
+        assert psd.render_via_server({"op": "ping"}, path, timeout=1) is None
+    finally:
+        listener.close()
+
+
+def test_private_dir(tmp_path):
+    private = tmp_path / "ps-doc"
+    psd._private_dir(str(private))
+    assert stat.S_IMODE(private.stat().st_mode) == 0o700
+    psd._private_dir(str(private))   # already ours: fine
+
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o755)
+    shared.chmod(0o755)
+    with pytest.raises(PermissionError):
+        psd._private_dir(str(shared))
+
+
+def test_default_socket_path_without_runtime_dir(monkeypatch):
+    monkeypatch.delenv("PS_DOC_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    path = psd.default_socket_path()
+    assert os.path.dirname(path) == f"/tmp/ps-doc-{os.getuid()}"
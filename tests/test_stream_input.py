@@ -0,0 +1,59 @@
+"""Streaming input (load_render_data / _JsonStream): results must not depend on chunk boundaries."""
+
+import io
+import json
+import random
+
+import pytest
+
+import ps_doc_skill as psd
+
+
+def _project(text: str, chunk: int) -> dict:
+    stream = psd._JsonStream(io.StringIO(text), chunk)
+    data = stream.project(psd._RENDER_FIELDS)
+    assert stream._peek() == ""
+    return data
+
+
+@pytest.mark.parametrize("cut", ["2015.", "2015", "201", "2015.5", "1e", "1e+"])
+def test_number_cut_at_chunk_boundary(tmp_path, cut):
+    # Pad a skipped string so the first 64 KiB read ends right after ``cut``
+    tail = '"account": {"founded": 2015.5, "key_volumes": {"agents": 1e+3}}}'
+    prefix = '{"junk": "'
+    number_at = tail.index("1e+3" if cut.startswith("1e") else "2015.5")
+    pad = psd._STREAM_CHUNK - len(prefix) - len('", ') - number_at - len(cut)
+    text = prefix + "x" * pad + '", ' + tail
+    assert text[psd._STREAM_CHUNK - len(cut):psd._STREAM_CHUNK] == cut
+    path = tmp_path / "payload.json"
+    path.write_text(text, encoding="utf-8")
+
+    assert psd.load_render_data(path)["account"] == {"founded": 2015.5, "key_volumes": {"agents": 1000.0}}
+
+
+def _number(rng: random.Random):
+    return rng.choice([
+        rng.randint(-10 ** 6, 10 ** 6),
+        round(rng.uniform(-1e4, 1e4), rng.randint(1, 6)),
+        float(f"{rng.uniform(1, 9):.3f}e{rng.randint(-8, 8)}"),
+        True, False, None,
+    ])
+
+
+def test_fuzzed_payloads_at_every_small_chunk_size():
+    rng = random.Random(7)
+    for _ in range(300):
+        payload = {
+            "noise": [_number(rng) for _ in range(rng.randint(0, 5))],
+            "account": {
+                "founded": _number(rng),
+                "key_volumes": {f"k{i}": _number(rng) for i in range(rng.randint(1, 4))},
+                "skipped": {"n": _number(rng)},
+            },
+            "opportunity": {"amount": _number(rng)},
+        }
+        text = json.dumps(payload, indent=rng.choice([None, 1]))
+        expected = {"founded": payload["account"]["founded"],
+                    "key_volumes": payload["account"]["key_volumes"]}
+        for chunk in range(1, 9):
+            assert _project(text, chunk)["account"] == expected, (chunk, text)
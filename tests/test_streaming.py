@@ -0,0 +1,63 @@
+"""The streaming backend: capped cells, its render cache entry and flat memory."""
+
+import json
+import subprocess
+import sys
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import ps_doc_skill as psd
+from conftest import SCRIPTS
+
+PAYLOAD = Path(__file__).resolve().parent / "fixtures" / "payloads" / "full.json"
+SECTIONS = ["general", "chat", "email", "voice"]
+RSS_GROWTH_LIMIT_KB = 1024   # peak RSS, 10k vs 1k next steps
+
+
+def _document_xml(path: Path) -> str:
+    with zipfile.ZipFile(path) as zf:
+        return zf.read("word/document.xml").decode("utf-8")
+
+
+def test_render_cache_keeps_backends_apart(tmp_path):
+    data = json.loads(PAYLOAD.read_text(encoding="utf-8"))
+    data["account"]["next_steps"] = [f"Ada to provide report {i}" for i in range(2 * psd.CELL_MAX_LINES)]
+    cache = tmp_path / "cache"
+    render = lambda backend: psd.generate_ps_doc(  # noqa: E731
+        "Acme Health", data, tmp_path / backend, SECTIONS, backend=backend,
+        generated=datetime(2026, 1, 31), cache_dir=cache)
+
+    assert "APPENDIX" not in _document_xml(render("skeleton"))
+    assert "APPENDIX" in _document_xml(render("streaming"))
+    assert "APPENDIX" not in _document_xml(render("ooxml"))
+
+
+_RSS_PROBE = """
+import json, resource, sys, tempfile
+sys.path.insert(0, sys.argv[1])
+import ps_doc_skill as psd
+
+data = json.loads(open(sys.argv[2], encoding="utf-8").read())
+with tempfile.TemporaryDirectory() as tmp:
+    psd.generate_ps_doc("Acme Health", data, tmp, %(sections)r, backend="streaming")
+    data["account"]["next_steps"] = [f"Next step {i}: follow up on the integration" for i in range(int(sys.argv[3]))]
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    psd.generate_ps_doc("Acme Health", data, tmp, %(sections)r, backend="streaming")
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before)
+""" % {"sections": SECTIONS}
+
+
+def _rss_growth_kb(next_steps: int) -> float:
+    """Peak RSS added by one streaming render, in a fresh interpreter (after a warm-up render)."""
+    out = subprocess.run([sys.executable, "-c", _RSS_PROBE, str(SCRIPTS), str(PAYLOAD), str(next_steps)],
+                         capture_output=True, text=True, check=True).stdout
+    return int(out) / (1024 if sys.platform == "darwin" else 1)   # bytes on macOS, KiB elsewhere
+
+
+def test_streaming_render_memory_is_flat():
+    pytest.importorskip("resource")
+    small, large = _rss_growth_kb(1000), _rss_growth_kb(10000)
+    assert large - small < RSS_GROWTH_LIMIT_KB, f"peak RSS grew {large - small:.0f} KiB ({small:.0f} -> {large:.0f})"
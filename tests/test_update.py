@@ -0,0 +1,137 @@
+"""--update: regenerate data-backed cells without overwriting hand edits."""
+
+import copy
+import json
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+import ps_doc_skill as psd
+
+PAYLOAD = Path(__file__).resolve().parent / "fixtures" / "payloads" / "full.json"
+SECTIONS = ["general", "chat", "email", "voice"]
+PROMISES = "Product promises made to the client / FRs?"
+
+
+@pytest.fixture
+def data() -> dict:
+    return json.loads(PAYLOAD.read_text(encoding="utf-8"))
+
+
+def _render(tmp_path, data, backend="skeleton") -> Path:
+    return psd.generate_ps_doc("Acme Health", data, tmp_path, SECTIONS, backend=backend,
+                               generated=datetime(2026, 1, 31))
+
+
+def _edit(path: Path, label: str, text: str) -> None:
+    doc = Document(str(path))
+    for table in doc.tables:
+        for row in table.rows:
+            if row.cells[0].text == label:
+                row.cells[1].text = text
+                doc.save(str(path))
+                return
+    raise AssertionError(f"no row {label!r}")
+
+
+def _value(path: Path, label: str) -> str:
+    for table in Document(str(path)).tables:
+        for row in table.rows:
+            if row.cells[0].text == label:
+                return row.cells[1].text
+    raise AssertionError(f"no row {label!r}")
+
+
+def _oversized(data: dict) -> dict:
+    """``data`` with more promises than a streaming cell shows."""
+    data["account"]["next_steps"] = [f"Ada to provide usage report {i}"
+                                     for i in range(2 * psd.CELL_MAX_LINES)]
+    return data
+
+
+@pytest.mark.parametrize("oversized", [False, True], ids=["fits", "oversized"])
+@pytest.mark.parametrize("backend", psd.BACKENDS)
+def test_same_data_changes_nothing(tmp_path, data, backend, oversized):
+    if oversized:
+        data = _oversized(data)
+    path = _render(tmp_path, data, backend)
+    before = path.read_bytes()
+    report = psd.update_ps_doc(path, data)
+    assert report["updated"] == report["conflicts"] == report["preserved"] == []
+    assert path.read_bytes() == before
+
+
+def test_hand_edit_survives_unrelated_data_change(tmp_path, data):
+    path = _render(tmp_path, data)
+    _edit(path, "Timezone", "PST (manual)")
+    data["account"]["close_date"] = "2027-03-01"
+
+    report = psd.update_ps_doc(path, data)
+
+    assert _value(path, "Timezone") == "PST (manual)"
+    assert "Timezone" in report["preserved"]
+    assert ("Expected Launch Date?", "2026-12-01", "2027-03-01") in report["updated"]
+    assert _value(path, "Expected Launch Date?") == "2027-03-01"
+    assert report["conflicts"] == []
+
+
+def test_hand_edit_with_changed_data_is_a_conflict(tmp_path, data):
+    path = _render(tmp_path, data)
+    _edit(path, "Timezone", "PST (manual)")
+    data["account"]["timezone"] = "CET"
+
+    report = psd.update_ps_doc(path, data)
+
+    assert report["conflicts"] == [("Timezone", "PST (manual)", "CET")]
+    assert _value(path, "Timezone") == "PST (manual)"
+
+
+def test_record_follows_updates(tmp_path, data):
+    path = _render(tmp_path, data)
+    changed = copy.deepcopy(data)
+    changed["account"]["close_date"] = "2027-03-01"
+    assert psd.update_ps_doc(path, changed)["updated"]
+    # The updated value is now the generated one: a later change applies again
+    changed["account"]["close_date"] = "2027-06-01"
+    report = psd.update_ps_doc(path, changed)
+    assert [u[0] for u in report["updated"]] == ["Expected Launch Date?", "Timeline"]
+
+
+def test_placeholder_never_overwrites(tmp_path, data):
+    path = _render(tmp_path, data)
+    del data["account"]["timezone"], data["account"]["hq"]
+    report = psd.update_ps_doc(path, data)
+    assert "Timezone" in report["preserved"]
+    assert _value(path, "Timezone") == "EST"
+
+
+def test_doc_without_record_reports_conflicts(tmp_path, data):
+    path = _render(tmp_path, data)
+    legacy = tmp_path / "legacy.docx"
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(legacy, "w") as dst:
+        for info in src.infolist():
+            if info.filename != "docProps/custom.xml":
+                dst.writestr(info, src.read(info))
+    data["account"]["close_date"] = "2027-03-01"
+
+    report = psd.update_ps_doc(legacy, data)
+
+    assert report["updated"] == []
+    assert ("Expected Launch Date?", "2026-12-01", "2027-03-01") in report["conflicts"]
+
+
+def test_streaming_overflow_is_not_rewritten(tmp_path, data):
+    path = _render(tmp_path, _oversized(data), "streaming")
+    capped = _value(path, PROMISES)
+    assert capped.endswith("more line(s) in the appendix")
+    data["account"]["next_steps"].append("Ada to provide a launch checklist")
+    data["account"]["close_date"] = "2027-03-01"
+
+    report = psd.update_ps_doc(path, data)
+
+    assert [c[0] for c in report["conflicts"]] == [PROMISES]
+    assert _value(path, PROMISES) == capped
+    assert _value(path, "Expected Launch Date?") == "2027-03-01"